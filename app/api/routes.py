@@ -19,12 +19,15 @@ from app.domain import (
     HardwareProfileDomain,
     MetricEntryDomain,
     ProviderDomain,
+    ProviderDomainIn,
     RegionDomain,
     SecurityTierDomain,
     ServiceTypeDomain,
     StatusDomain,
     TeamDomain,
+    TeamDomainIn,
 )
+from app.domain.examples import EXAMPLES
 from app.domain.gold_entities import (
     AssetMetricContext,
     AssetUtilization,
@@ -56,6 +59,10 @@ router = APIRouter(
     responses={401: {"description": "Not authenticated"}}
     )
 
+def _list_example(entity: str) -> dict[int | str, dict[str, Any]]:
+    """Builds the OpenAPI 200 response example for list endpoints of a Gold entity."""
+    return {200: {"content": {"application/json": {"example": [EXAMPLES[entity]]}}}}
+
 # --- 1. ADMIN & SEEDING ---
 @router.post("/seed", tags=["Admin"])
 def seed_database() -> dict[str, str]:
@@ -104,7 +111,11 @@ def global_search(
 
 
 # --- GOLD LAYER ANALYTICS (Querying the Virtual View) ---
-@router.get("/comprehensive-metrics", tags=["Gold Layer - Analytics"])
+@router.get(
+    "/comprehensive-metrics",
+    tags=["Gold Layer - Analytics"],
+    responses=_list_example("AssetMetricContext")
+)
 def read_comprehensive_metrics(
     session: Annotated[Session, Depends(get_session)],
     provider_name: Annotated[
@@ -126,7 +137,11 @@ def read_comprehensive_metrics(
     service = GoldSearchService(session)
     return service.read_comprehensive_metrics(provider_name=provider_name)
 
-@router.get("/assets/utilization", tags=["Gold Layer - Analytics"])
+@router.get(
+    "/assets/utilization",
+    tags=["Gold Layer - Analytics"],
+    responses=_list_example("AssetUtilization")
+)
 def search_assets_utilization(
     session: Annotated[Session, Depends(get_session)],
     provider_name: Annotated[
@@ -142,7 +157,11 @@ def search_assets_utilization(
     service = GoldSearchService(session)
     return service.search_assets_utilization(provider_name=provider_name)
 
-@router.get("/costs/team-report", tags=["Gold Layer - Analytics"])
+@router.get(
+    "/costs/team-report",
+    tags=["Gold Layer - Analytics"],
+    responses=_list_example("TeamCost")
+)
 def get_team_costs(
     session: Annotated[Session, Depends(get_session)]
 ) -> list[TeamCost]:
@@ -151,7 +170,11 @@ def get_team_costs(
     return service.get_team_cost_report()
         
 
-@router.get("/security/compliance", tags=["Gold Layer - Analytics"])
+@router.get(
+    "/security/compliance",
+    tags=["Gold Layer - Analytics"],
+    responses=_list_example("SecurityCompliance")
+)
 def get_security_posture(
     session: Annotated[Session, Depends(get_session)]
 ) -> list[SecurityCompliance]:
@@ -161,7 +184,11 @@ def get_security_posture(
     service = GoldSearchService(session)
     return service.search_security_risks()
 
-@router.get("/efficiency/waste-analysis", tags=["Gold Layer - Analytics"])
+@router.get(
+    "/efficiency/waste-analysis",
+    tags=["Gold Layer - Analytics"],
+    responses=_list_example("ResourceEfficiency")
+)
 def get_efficiency(
     session: Annotated[Session, Depends(get_session)],
     waste_category: Annotated[
@@ -535,7 +562,7 @@ def delete_hardware_profiles_batch(
 # --- Provider ---
 @router.post("/providers/", tags=["Dimensions - Provider"], status_code=status.HTTP_201_CREATED)
 def create_provider(
-    data: ProviderDomain,
+    data: ProviderDomainIn,
     session: Annotated[Session, Depends(get_session)]
 ) -> ProviderDomain:
     """Full CRUD: Persists a single cloud infrastructure provider."""
@@ -544,7 +571,7 @@ def create_provider(
 
 @router.post("/providers/batch", tags=["Dimensions - Provider"], status_code=status.HTTP_201_CREATED)
 def create_providers_batch(
-    data: list[ProviderDomain],
+    data: list[ProviderDomainIn],
     session: Annotated[Session, Depends(get_session)]
 ) -> list[ProviderDomain]:
     """Requirement: Batch CRUD. Ingests multiple providers in one transaction."""
@@ -574,7 +601,7 @@ def get_provider(
 @router.put("/providers/{id}", tags=["Dimensions - Provider"])
 def update_provider(
     id: int,
-    data: ProviderDomain,
+    data: ProviderDomainIn,
     session: Annotated[Session, Depends(get_session)]
 ) -> ProviderDomain:
     """Full CRUD: Updates an existing cloud provider record."""
@@ -583,7 +610,7 @@ def update_provider(
 
 @router.put("/providers/batch", tags=["Dimensions - Provider"])
 def update_providers_batch(
-    data: list[ProviderDomain],
+    data: list[ProviderDomainIn],
     session: Annotated[Session, Depends(get_session)]
 ) -> list[ProviderDomain]:
     """Requirement: Batch CRUD. Updates multiple providers using their provider_name."""
@@ -991,7 +1018,7 @@ def delete_statuses_batch(
 # --- Team ---
 @router.post("/teams/", tags=["Dimensions - Team"], status_code=status.HTTP_201_CREATED)
 def create_team(
-    data: TeamDomain,
+    data: TeamDomainIn,
     session: Annotated[Session, Depends(get_session)]
 ) -> TeamDomain:
     """Full CRUD: Persists a single organizational team."""
@@ -1000,7 +1027,7 @@ def create_team(
 
 @router.post("/teams/batch", tags=["Dimensions - Team"], status_code=status.HTTP_201_CREATED)
 def create_teams_batch(
-    data: list[TeamDomain],
+    data: list[TeamDomainIn],
     session: Annotated[Session, Depends(get_session)]
 ) -> list[TeamDomain]:
     """Requirement: Batch CRUD. Ingests multiple teams in one transaction."""
@@ -1030,7 +1057,7 @@ def get_team(
 @router.put("/teams/{id}", tags=["Dimensions - Team"])
 def update_team(
     id: int,
-    data: TeamDomain,
+    data: TeamDomainIn,
     session: Annotated[Session, Depends(get_session)]
 ) -> TeamDomain:
     """Full CRUD: Updates an existing team record."""
@@ -1039,7 +1066,7 @@ def update_team(
 
 @router.put("/teams/batch", tags=["Dimensions - Team"])
 def update_teams_batch(
-    data: list[TeamDomain],
+    data: list[TeamDomainIn],
     session: Annotated[Session, Depends(get_session)]
 ) -> list[TeamDomain]:
     """Requirement: Batch CRUD. Updates multiple teams using their team_name."""
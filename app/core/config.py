@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     # API Credentials
@@ -29,7 +29,6 @@ class Settings(BaseSettings):
     TYPESENSE_API_KEY: str
     TYPESENSE_TIMEOUT: int
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
\ No newline at end of file
@@ -3,6 +3,7 @@ import os
 from collections.abc import Generator
 
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 from sqlmodel import Session, SQLModel, create_engine, text
 
 
@@ -12,8 +13,17 @@ database_url = os.getenv("DATABASE_URL")
 if not database_url:
     raise ValueError("DATABASE_URL environment variable is not set in .env")
 
-# Use pool_pre_ping for stability with Supabase/PgBouncer
-engine = create_engine(database_url, pool_pre_ping=True)
+# Use pool_pre_ping for stability with Supabase/PgBouncer.
+# The pool is sized for concurrent API workers, connections are recycled hourly
+# before the pooler drops them, and the compiled-statement cache is enlarged so
+# the services' repeated select/insert/update shapes compile only once.
+# SQLite (local tests) uses a singleton pool that rejects the sizing arguments.
+pool_options = (
+    {"pool_size": 30, "max_overflow": 10, "pool_recycle": 3600}
+    if make_url(database_url).get_backend_name() != "sqlite"
+    else {}
+)
+engine = create_engine(database_url, pool_pre_ping=True, query_cache_size=1200, **pool_options)
 logger = logging.getLogger(__name__)
 
 def create_db_and_tables() -> None:
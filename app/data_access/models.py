@@ -1,6 +1,6 @@
 from datetime import UTC, date, datetime
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
 
@@ -9,7 +9,16 @@ from sqlmodel import Field, SQLModel
 class DimAsset(SQLModel, table=True):
     """Anchor dimension for cloud resources with Delta tracking."""
     __tablename__ = "dim_asset"
-    __table_args__ = {"schema": "silver"}
+
+    # Partial index over live assets only: serves the active listing's
+    # ORDER BY serial_number LIMIT n without touching soft-deleted rows
+    __table_args__ = (
+        Index(
+            "ix_dim_asset_active_serial", "serial_number",
+            postgresql_where=text("is_active"), sqlite_where=text("is_active")
+        ),
+        {"schema": "silver"}
+    )
     id: int | None = Field(default=None, primary_key=True)
     # Core Data
     resource_name: str
@@ -28,7 +37,16 @@ class DimAsset(SQLModel, table=True):
 class DimCostCenter(SQLModel, table=True):
     """Dimension for Financial Tracking with Delta tracking."""
     __tablename__ = "dim_cost_center"
-    __table_args__ = {"schema": "silver"}
+
+    # Partial index over live cost centers only: serves the active listing's
+    # ORDER BY center_code LIMIT n without touching soft-deleted rows
+    __table_args__ = (
+        Index(
+            "ix_dim_cost_center_active_code", "center_code",
+            postgresql_where=text("is_active"), sqlite_where=text("is_active")
+        ),
+        {"schema": "silver"}
+    )
     id: int | None = Field(default=None, primary_key=True)
     # Core Data
     center_code: str = Field(index=True, unique=True)
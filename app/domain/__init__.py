@@ -20,12 +20,12 @@ from .hardware_profile import HardwareProfileDomain
 from .metric_entry import MetricEntryDomain
 
 # 2. Contextual Dimensions
-from .provider import ProviderDomain
+from .provider import ProviderDomain, ProviderDomainIn
 from .region import RegionDomain
 from .security_tier import SecurityTierDomain
 from .service_type import ServiceTypeDomain
 from .status import StatusDomain
-from .team import TeamDomain
+from .team import TeamDomain, TeamDomainIn
 
 
 __all__ = [
@@ -36,6 +36,7 @@ __all__ = [
     "HardwareProfileDomain",
     "MetricEntryDomain",
     "ProviderDomain",
+    "ProviderDomainIn",
     "RegionDomain",
     "ResourceEfficiency",
     "SecurityCompliance",
@@ -43,5 +44,6 @@ __all__ = [
     "ServiceTypeDomain",
     "StatusDomain",
     "TeamCost",
-    "TeamDomain"
+    "TeamDomain",
+    "TeamDomainIn"
 ]
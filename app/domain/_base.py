@@ -0,0 +1,53 @@
+from typing import Any, Self, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+
+# One list validator per entity class, built at import as each class is defined
+_list_adapters: dict[type, TypeAdapter[Any]] = {}
+
+
+class DomainModelMixin:
+    """Shared behaviour for the pydantic domain entities.
+
+    Mixed in ahead of ``BaseModel`` (``class XDomain(DomainModelMixin, BaseModel)``)
+    so every entity gets the same record mapping and batch validator without
+    repeating them per module.
+    """
+
+    @classmethod
+    def from_db(cls, db_obj: Any) -> Self:
+        """Builds the entity from a trusted database record without re-validation.
+
+        Postgres is the source of truth for stored rows, so the field values
+        are copied straight across via ``model_construct``.
+
+        Args:
+            db_obj (Any): An ORM instance or result row exposing the fields as attributes.
+
+        Returns:
+            Self: The domain representation of the stored record.
+        """
+        model = cast(type[BaseModel], cls)
+        return cast(Self, model.model_construct(**{name: getattr(db_obj, name) for name in model.model_fields}))
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Builds the ``list[cls]`` validator once the model class is complete.
+
+        Runs at import, so the first request never pays for schema construction.
+        """
+        super().__pydantic_init_subclass__(**kwargs)  # type: ignore[misc]
+        _list_adapters[cls] = TypeAdapter(list[cls])  # type: ignore[valid-type]
+
+    @classmethod
+    def list_adapter(cls) -> TypeAdapter[list[Self]]:
+        """Returns the batch validator for ``list[cls]``.
+
+        Validating a whole batch through it costs one pydantic-core call
+        instead of one model validation per row.
+
+        Returns:
+            TypeAdapter[list[Self]]: The list validator built for this entity at import.
+        """
+        return cast(TypeAdapter[list[Self]], _list_adapters[cls])
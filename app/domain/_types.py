@@ -0,0 +1,8 @@
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+
+# Cheap shape check for contacts coming from trusted Silver rows; full RFC/IDN
+# parsing via EmailStr is reserved for the API input models (the ``*In`` variants).
+ContactEmail = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
@@ -6,9 +6,13 @@ from pydantic import BaseModel, Field, GetCoreSchemaHandler, field_validator
 from pydantic_core import core_schema
 from sqlalchemy.orm import Mapped
 
+from ._base import DomainModelMixin
+
 
 T = TypeVar("T")
 
+_SERIAL_RE = re.compile(r"^RES-[A-Z0-9]{4}-[A-Z0-9]{4}$")
+
 class _MappedAnnotation:
     @classmethod
     def __get_pydantic_core_schema__(
@@ -27,7 +31,7 @@ class _MappedAnnotation:
 PydanticMapped = Annotated[Mapped[T], _MappedAnnotation]
 
 
-class AssetDomain(BaseModel):
+class AssetDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Cloud Assets Infrastructure.
 
     This anchor asset represents a specific resource (e.g., a Server, Database,
@@ -92,8 +96,7 @@ class AssetDomain(BaseModel):
             ValueError: If the serial does not match the required pattern.
         """
         v = v.strip().upper()
-        pattern = r"^RES-[A-Z0-9]{4}-[A-Z0-9]{4}$"
-        if not re.match(pattern, v):
+        if not _SERIAL_RE.match(v):
             raise ValueError("serial_number must follow format 'RES-XXXX-YYYY'")
         return v
 
@@ -3,8 +3,12 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class CostCenterDomain(BaseModel):
+
+_CENTER_CODE_RE = re.compile(r"^CC-\d{4}$")
+
+class CostCenterDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Financial Cost Center.
     
     Attributes:
@@ -29,12 +33,13 @@ class CostCenterDomain(BaseModel):
     def validate_code_format(cls, v: str) -> str:
         """Standardizes cost center code to CC-XXXX format."""
         v = v.strip().upper()
-        if not re.match(r"^CC-\d{4}$", v):
+        if not _CENTER_CODE_RE.match(v):
             raise ValueError("center_code must follow the format 'CC-1234'")
         return v
 
     model_config = {
         "from_attributes": True, # Allows Pydantic to read from SQLModel objects
+        "frozen": True, # Listing pages are cached and shared across requests
         "json_schema_extra": {
             "example": {
                 "center_code": "CC-8800",
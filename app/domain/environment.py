@@ -3,8 +3,14 @@ from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class EnvironmentDomain(BaseModel):
+
+# Canonical spellings accepted by the env_name Literal (used as a fast path)
+_CANONICAL_ENV_NAMES = frozenset({"Production", "Staging", "Development", "UAT", "Sandbox"})
+
+
+class EnvironmentDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Deployment Environment.
 
     Classifies resources based on their role in the software development
@@ -46,6 +52,9 @@ class EnvironmentDomain(BaseModel):
             str: The cleaned environment name.
         """
         if isinstance(v, str):
+            # Already-clean values (e.g. re-validated DB rows) skip the rebuild
+            if v in _CANONICAL_ENV_NAMES:
+                return v
             cleaned = v.strip().upper()
             # If it's UAT, keep it all caps; otherwise, use Title Case for others
             if cleaned == "UAT":
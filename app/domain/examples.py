@@ -0,0 +1,72 @@
+from typing import Any
+
+
+# OpenAPI examples for the Gold Layer read models.
+# Kept out of the models' model_config so the validators stay lean; the
+# FastAPI routes attach them to the documented responses instead.
+EXAMPLES: dict[str, dict[str, Any]] = {
+    "AssetMetricContext": {
+        "id": 1,
+        "asset_id": 501,
+        "resource_name": "prod-api-server-01",
+        "serial_number": "XYZ-99L-001",
+        "provider_name": "AWS",
+        "hardware_spec": "m5.xlarge",
+        "region_code": "us-east-1",
+        "team_name": "Cloud-Ops",
+        "service_name": "EC2-Compute",
+        "service_category": "IaaS",
+        "department": "Engineering",
+        "env_name": "Production",
+        "status_name": "Active",
+        "center_code": "CC-104",
+        "security_tier": "Critical",
+        "full_date": "2023-10-27",
+        "cpu_usage_avg": 42.5,
+        "memory_usage_avg": 68.2,
+        "hourly_cost": 0.192,
+        "uptime_seconds": 3600,
+        "source_timestamp": "2023-10-27T10:00:00Z",
+        "updated_at": "2023-10-27T10:05:00Z"
+    },
+    "AssetUtilization": {
+        "metric_id": 101,
+        "full_date": "2023-10-27",
+        "resource_name": "aws-ec2-prod-01",
+        "serial_number": "SN-998877",
+        "provider_name": "AWS",
+        "team_name": "Platform-Eng",
+        "center_code": "FIN-01",
+        "cpu_usage_avg": 4.5,
+        "memory_usage_avg": 12.2,
+        "description": "Primary web server",
+        "daily_cost": 150.50
+    },
+    "TeamCost": {
+        "year": 2023,
+        "month": 10,
+        "month_name": "October",
+        "team_name": "Data-Science",
+        "department": "R&D",
+        "total_monthly_cost": 12500.75,
+        "avg_cpu_efficiency": 0.65
+    },
+    "SecurityCompliance": {
+        "asset_id": 5001,
+        "resource_name": "db-prod-sql",
+        "serial_number": "VOL-123",
+        "tier_name": "Mission Critical",
+        "env_name": "Production",
+        "status_name": "MAINTENANCE",
+        "last_seen": "2023-10-27T10:00:00"
+    },
+    "ResourceEfficiency": {
+        "asset_id": 99,
+        "resource_name": "legacy-app-server",
+        "avg_cpu": 2.1,
+        "avg_mem": 45.0,
+        "total_cost": 450.00,
+        "efficiency_score": 0.05,
+        "waste_index": "High Waste"
+    }
+}
@@ -1,11 +1,59 @@
 from datetime import date, datetime
+from typing import Annotated, Any, Literal, Self, cast, get_args
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    computed_field,
+    model_validator,
+)
 
+from ._base import DomainModelMixin
 
-class BaseDomainModel(BaseModel):
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+_MONTH_ORDINALS = {name: i for i, name in enumerate(_MONTH_NAMES, start=1)}
+
+
+def _month_ordinal(name: Any) -> int:
+    """Maps a month name (any casing) onto its 1-12 ordinal.
+
+    Raises:
+        ValueError: If the month name is not recognised.
+    """
+    month = _MONTH_ORDINALS.get(name) or _MONTH_ORDINALS.get(str(name).capitalize())
+    if month is None:
+        raise ValueError(f"Invalid month name: {name}")
+    return month
+
+# Business Rule: If the sensor sends a value > 100 due to a spike,
+# we cap it at 100 for domain logic.
+CappedPercent = Annotated[float, Field(ge=0.0), AfterValidator(lambda v: v if v <= 100.0 else 100.0)]
+
+EnvName = Literal["Production", "Staging", "Development", "UAT", "Sandbox"]
+WasteIndex = Literal["High Waste", "Potential Waste", "Optimized", "Normal"]
+_ENV_SET = frozenset(get_args(EnvName))
+_WASTE_SET = frozenset(get_args(WasteIndex))
+
+# Domain logic: unknown values are classified under a safe default
+# instead of failing the row.
+StandardEnvName = Annotated[
+    EnvName, BeforeValidator(lambda v: v if isinstance(v, str) and v in _ENV_SET else "Sandbox")
+]
+StandardWasteIndex = Annotated[
+    WasteIndex, BeforeValidator(lambda v: v if isinstance(v, str) and v in _WASTE_SET else "Normal")
+]
+
+class BaseDomainModel(DomainModelMixin, BaseModel):
     """Base config for all domain entities."""
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only view rows: immutable, and no per-instance extras dict
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class AssetMetricContext(BaseDomainModel):
     """The complete Enriched Domain Entity representing the 'fact_asset_metrics' view.
@@ -41,37 +89,7 @@ class AssetMetricContext(BaseDomainModel):
     source_timestamp: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_schema_extra={
-            "example": {
-                "id": 1,
-                "asset_id": 501,
-                "resource_name": "prod-api-server-01",
-                "serial_number": "XYZ-99L-001",
-                "provider_name": "AWS",
-                "hardware_spec": "m5.xlarge",
-                "region_code": "us-east-1",
-                "team_name": "Cloud-Ops",
-                "service_name": "EC2-Compute",
-                "service_category": "IaaS",
-                "department": "Engineering",
-                "env_name": "Production",
-                "status_name": "Active",
-                "center_code": "CC-104",
-                "security_tier": "Critical",
-                "full_date": "2023-10-27",
-                "cpu_usage_avg": 42.5,
-                "memory_usage_avg": 68.2,
-                "hourly_cost": 0.192,
-                "uptime_seconds": 3600,
-                "source_timestamp": "2023-10-27T10:00:00Z",
-                "updated_at": "2023-10-27T10:05:00Z"
-            }
-        }
-    )
-
-class AssetUtilization(BaseModel):
+class AssetUtilization(BaseDomainModel):
     """Domain entity for Asset Utilization.
     Includes validation to ensure metric percentages are realistic.
     """
@@ -82,72 +100,72 @@ class AssetUtilization(BaseModel):
     provider_name: str
     team_name: str
     center_code: str
-    cpu_usage_avg: float = Field(ge=0.00, le=100.00)
+    cpu_usage_avg: CappedPercent
     memory_usage_avg: float = Field(ge=0.00)
     description: str | None = None
     daily_cost: float = Field(ge=0.00)
 
-    @field_validator('cpu_usage_avg')
-    @classmethod
-    def validate_percentages(cls, v: float) -> float:
-        # Business Rule: If the sensor sends a value > 100 due to a spike,
-        # we cap it at 100 for domain logic.
-        return min(v, 100.0)
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "metric_id": 101,
-                "full_date": "2023-10-27",
-                "resource_name": "aws-ec2-prod-01",
-                "serial_number": "SN-998877",
-                "provider_name": "AWS",
-                "team_name": "Platform-Eng",
-                "center_code": "FIN-01",
-                "cpu_usage_avg": 4.5,
-                "memory_usage_avg": 12.2,
-                "description": "Primary web server",
-                "daily_cost": 150.50
-            }
-        }
-    )
-
-class TeamCost(BaseModel):
+class TeamCost(BaseDomainModel):
     """Domain entity for Team Costs.
     Validates that financial data remains non-negative.
     """
     year: int = Field(gt=2000)
-    month_name: str
+    month: int = Field(ge=1, le=12)
     team_name: str
     department: str
     total_monthly_cost: float = Field(ge=0)
     avg_cpu_efficiency: float = Field(ge=0)
 
-    @field_validator('month_name')
+    @model_validator(mode='before')
     @classmethod
-    def validate_month(cls, v: str) -> str:
-        months = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-        if v.capitalize() not in months:
-            raise ValueError(f"Invalid month name: {v}")
-        return v.capitalize()
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "year": 2023,
-                "month_name": "October",
-                "team_name": "Data-Science",
-                "department": "R&D",
-                "total_monthly_cost": 12500.75,
-                "avg_cpu_efficiency": 0.65
-            }
-        }
-    )
-
-class SecurityCompliance(BaseModel):
+    def month_from_name(cls, data: Any) -> Any:
+        """Maps the Gold view's ``month_name`` column onto the ``month`` ordinal.
+
+        Args:
+            data (Any): Raw input, usually a dumped ``TeamCostMView`` row.
+
+        Returns:
+            Any: The input with ``month_name`` replaced by ``month``.
+
+        Raises:
+            ValueError: If the month name is not recognised.
+        """
+        if isinstance(data, dict):
+            if "month_name" not in data:
+                return data
+            data = dict(data)
+            name = data.pop("month_name")
+        else:
+            # Attribute-style input (from_attributes), e.g. a TeamCostMView row
+            name = getattr(data, "month_name", None)
+            if name is None or hasattr(data, "month"):
+                return data
+            data = {field: getattr(data, field) for field in cls.model_fields if field != "month"}
+        data.setdefault("month", _month_ordinal(name))
+        return data
+
+    @classmethod
+    def from_db(cls, db_obj: Any) -> Self:
+        """Builds the entity from a ``TeamCostMView`` row without re-validation.
+
+        Args:
+            db_obj (Any): A row exposing ``month_name`` (or ``month``) and the other fields.
+
+        Returns:
+            Self: The domain representation of the stored row.
+        """
+        if hasattr(db_obj, "month"):
+            return super().from_db(db_obj)
+        values = {name: getattr(db_obj, name) for name in cls.model_fields if name != "month"}
+        return cast(Self, cls.model_construct(month=_month_ordinal(db_obj.month_name), **values))
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def month_name(self) -> str:
+        """The calendar month name, derived from ``month`` at serialization time."""
+        return _MONTH_NAMES[self.month - 1]
+
+class SecurityCompliance(BaseDomainModel):
     """Domain entity for Security Posture.
     Ensures environment names follow corporate standards.
     """
@@ -155,34 +173,11 @@ class SecurityCompliance(BaseModel):
     resource_name: str
     serial_number: str
     tier_name: str
-    env_name: str = "Sandbox"
+    env_name: StandardEnvName = "Sandbox"
     status_name: str
     last_seen: datetime | None = None
 
-    @field_validator('env_name')
-    @classmethod
-    def enforce_env_standard(cls, v: str) -> str:
-        allowed = ['Production', 'Staging', 'Development', 'UAT', 'Sandbox']
-        if v not in allowed:
-            # Domain logic: classify unknown envs as 'Sandbox'
-            return 'Sandbox'
-        return v
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "asset_id": 5001,
-                "resource_name": "db-prod-sql",
-                "serial_number": "VOL-123",
-                "tier_name": "Mission Critical",
-                "env_name": "Production",
-                "status_name": "MAINTENANCE",
-                "last_seen": "2023-10-27T10:00:00"
-            }
-        }
-    )
-
-class ResourceEfficiency(BaseModel):
+class ResourceEfficiency(BaseDomainModel):
     """Domain entity for Resource Efficiency.
     Includes a waste_index validator.
     """
@@ -192,25 +187,5 @@ class ResourceEfficiency(BaseModel):
     avg_mem: float = Field(ge=0)
     total_cost: float = Field(ge=0)
     efficiency_score: float = Field(ge=0)
-    waste_index: str = "Normal"
+    waste_index: StandardWasteIndex = "Normal"
 
-    @field_validator('waste_index')
-    @classmethod
-    def validate_waste_category(cls, v: str) -> str:
-        if v not in ["High Waste", "Potential Waste", "Optimized", "Normal"]:
-            return "Normal"
-        return v
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "asset_id": 99,
-                "resource_name": "legacy-app-server",
-                "avg_cpu": 2.1,
-                "avg_mem": 45.0,
-                "total_cost": 450.00,
-                "efficiency_score": 0.05,
-                "waste_index": "High Waste"
-            }
-        }
-    )
@@ -2,8 +2,10 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class HardwareProfileDomain(BaseModel):
+
+class HardwareProfileDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Resource Hardware Profile.
     
     Attributes:
@@ -28,9 +30,10 @@ class HardwareProfileDomain(BaseModel):
     @classmethod
     def standardize_name(cls, v: str) -> str:
         """Ensures hardware profiles are stored in lowercase."""
-        if isinstance(v, str):
+        try:
             return v.strip().lower()
-        return v
+        except AttributeError:
+            return v
 
     model_config = {
         "from_attributes": True, # Enables SQLModel compatibility
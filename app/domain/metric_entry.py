@@ -1,9 +1,12 @@
 from datetime import UTC, datetime
+from functools import partial
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class MetricEntryDomain(BaseModel):
+
+class MetricEntryDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Cloud Metric Snapshot.
 
     This model represents the 'Facts' being ingested. It captures
@@ -38,8 +41,9 @@ class MetricEntryDomain(BaseModel):
     uptime_seconds: int = Field(..., description="Total seconds of operation in the interval", ge=0)
 
     # Metadata (Crucial for Silver Layer)
+    # Bulk ingestion should pass source_timestamp explicitly so the factory is skipped
     source_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=partial(datetime.now, UTC),
         description="The moment the metric was ingested"
     )
 
@@ -3,8 +3,11 @@ from typing import Literal
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from ._base import DomainModelMixin
+from ._types import ContactEmail
 
-class ProviderDomain(BaseModel):
+
+class ProviderDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Cloud Infrastructure Provider.
 
     This entity defines the source platform (e.g., AWS, Azure, GCP)
@@ -13,7 +16,7 @@ class ProviderDomain(BaseModel):
     Attributes:
         provider_name (str): Unique name of the platform.
         provider_type (str): Classification of the provider (Cloud vs. On-Prem).
-        support_contact (EmailStr): Support or billing contact for this provider.
+        support_contact (str): Support or billing contact for this provider.
     """
     # 1. Database Identity
     id: int | None = None
@@ -24,7 +27,7 @@ class ProviderDomain(BaseModel):
         "Public Cloud",
         description="The infrastructure classification"
     )
-    support_contact: EmailStr = Field(..., description="Administrative contact email")
+    support_contact: ContactEmail = Field(..., description="Administrative contact email")
 
     # 3. Pipeline Metadata (Matching DimProvider)
     is_active: bool = Field(default=True)
@@ -35,21 +38,23 @@ class ProviderDomain(BaseModel):
     @classmethod
     def standardize_provider_name(cls, v: str) -> str:
         """Ensures provider names are uppercase for consistent joining."""
-        if isinstance(v, str):
+        try:
             return v.strip().upper()
-        return v
+        except AttributeError:
+            return v
 
     @field_validator('provider_type', mode='before')
     @classmethod
     def clean_provider_type(cls, v: str) -> str:
         """Fixes casing issues before the Literal check (e.g., 'public cloud' -> 'Public Cloud')."""
-        if isinstance(v, str):
+        try:
             cleaned = v.strip().title()
-            # Handle the specific hyphenation in 'On-Premise' if necessary
-            if cleaned == "On-Premise":
-                return "On-Premise"
-            return cleaned
-        return v
+        except AttributeError:
+            return v
+        # Handle the specific hyphenation in 'On-Premise' if necessary
+        if cleaned == "On-Premise":
+            return "On-Premise"
+        return cleaned
 
     model_config = {
         "from_attributes": True, # Crucial for DimProvider -> ProviderDomain conversion
@@ -62,3 +67,12 @@ class ProviderDomain(BaseModel):
             }
         }
     }
+
+
+class ProviderDomainIn(ProviderDomain):
+    """API input variant of ``ProviderDomain`` with strict email validation.
+
+    Attributes:
+        support_contact (EmailStr): Support or billing contact, validated by email-validator.
+    """
+    support_contact: EmailStr = Field(..., description="Administrative contact email")
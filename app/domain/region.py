@@ -3,8 +3,12 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class RegionDomain(BaseModel):
+
+_REGION_RE = re.compile(r"^[a-z0-9\-]+$")
+
+class RegionDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Geographic or Logical Region.
 
     Represents specific data center locations (e.g., us-east-1, eu-central-1).
@@ -31,11 +35,12 @@ class RegionDomain(BaseModel):
     @classmethod
     def validate_region_code(cls, v: str) -> str:
         """Standardizes region codes to lowercase and validates naming format."""
-        if not isinstance(v, str):
+        try:
+            v = v.strip().lower()
+        except AttributeError:
             return v
 
-        v = v.strip().lower()
-        if not re.match(r"^[a-z0-9\-]+$", v):
+        if not _REGION_RE.match(v):
             raise ValueError(f"region_code '{v}' must only contain lowercase letters, numbers, and hyphens")
         return v
 
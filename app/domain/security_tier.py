@@ -3,8 +3,10 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class SecurityTierDomain(BaseModel):
+
+class SecurityTierDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Security and Compliance Tier.
     
     Attributes:
@@ -29,9 +31,10 @@ class SecurityTierDomain(BaseModel):
     @classmethod
     def validate_tier_name(cls, v: Any) -> Any:
         """Ensures the tier name is Title Case to match the Literal allowed list."""
-        if isinstance(v, str):
+        try:
             return v.strip().title()
-        return v
+        except AttributeError:
+            return v
 
     model_config = {
         "from_attributes": True, # Crucial for SQLModel -> Pydantic conversion
@@ -3,8 +3,10 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class ServiceTypeDomain(BaseModel):
+
+class ServiceTypeDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of a Cloud Service Classification.
 
     Defines what the resource actually is (e.g., Virtual Machine,
@@ -35,17 +37,19 @@ class ServiceTypeDomain(BaseModel):
     @classmethod
     def standardize_service_name(cls, v: Any) -> Any:
         """Cleans and uppercases technical service identifiers."""
-        if isinstance(v, str):
+        try:
             return v.strip().upper()
-        return v
+        except AttributeError:
+            return v
 
     @field_validator('category', mode='before')
     @classmethod
     def validate_category(cls, v: Any) -> Any:
         """Standardizes category to Title Case before the Literal check."""
-        if isinstance(v, str):
+        try:
             return v.strip().title()
-        return v
+        except AttributeError:
+            return v
 
     model_config = {
         "from_attributes": True, # Required for SQLModel -> Pydantic conversion
@@ -3,8 +3,10 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from ._base import DomainModelMixin
 
-class StatusDomain(BaseModel):
+
+class StatusDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of an Operational Status.
 
     Represents the current state of a cloud resource at the time of
@@ -32,9 +34,10 @@ class StatusDomain(BaseModel):
     @classmethod
     def standardize_status(cls, v: Any) -> Any:
         """Ensures status names are stored in uppercase for consistent joining."""
-        if isinstance(v, str):
+        try:
             return v.strip().upper()
-        return v
+        except AttributeError:
+            return v
 
     model_config = {
         "from_attributes": True, # Crucial for SQLModel -> Pydantic conversion
@@ -3,8 +3,11 @@ from typing import Any
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from ._base import DomainModelMixin
+from ._types import ContactEmail
 
-class TeamDomain(BaseModel):
+
+class TeamDomain(DomainModelMixin, BaseModel):
     """The pure domain representation of an Organizational Team.
 
     Represents the team responsible for managing and paying for a specific
@@ -13,7 +16,7 @@ class TeamDomain(BaseModel):
     Attributes:
         team_name (str): Unique name of the team (e.g., DevOps, Data Science).
         department (str): Higher-level organizational unit (e.g., Engineering, Finance).
-        lead_email (EmailStr): Primary technical contact for the team.
+        lead_email (str): Primary technical contact for the team.
     """
     # 1. Database Identity
     id: int | None = None
@@ -21,7 +24,7 @@ class TeamDomain(BaseModel):
     # 2. Core Data
     team_name: str = Field(..., description="Unique name of the team", min_length=2)
     department: str = Field(..., description="Organizational department")
-    lead_email: EmailStr = Field(..., description="Primary contact for technical or billing issues")
+    lead_email: ContactEmail = Field(..., description="Primary contact for technical or billing issues")
 
     # 3. Pipeline Metadata (Matching DimTeam)
     is_active: bool = Field(default=True)
@@ -32,9 +35,10 @@ class TeamDomain(BaseModel):
     @classmethod
     def clean_team_metadata(cls, v: Any) -> Any:
         """Standardizes team and department names using Title Case."""
-        if isinstance(v, str):
+        try:
             return v.strip().title()
-        return v
+        except AttributeError:
+            return v
 
     model_config = {
         "from_attributes": True, # Crucial for DimTeam -> TeamDomain conversion
@@ -47,3 +51,12 @@ class TeamDomain(BaseModel):
             }
         }
     }
+
+
+class TeamDomainIn(TeamDomain):
+    """API input variant of ``TeamDomain`` with strict email validation.
+
+    Attributes:
+        lead_email (EmailStr): Primary team contact, validated by email-validator.
+    """
+    lead_email: EmailStr = Field(..., description="Primary contact for technical or billing issues")
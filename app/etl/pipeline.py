@@ -1,14 +1,43 @@
 import io
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import IO, TypeVar
 
 import polars as pl
 from pypdf import PdfReader
+from sqlalchemy import insert
 from sqlmodel import Session, SQLModel
 
 from app.data_access.database import engine
 
 
+# Rows per INSERT statement; bounds memory and bind-parameter counts per round trip.
+LOAD_BATCH_SIZE = 5000
+
+# Calendar labels keyed by Polars' month (1-12) and ISO weekday (1=Monday) ordinals
+_MONTH_NAMES = {
+    1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June",
+    7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"
+}
+_DAY_NAMES = {
+    1: "Monday", 2: "Tuesday", 3: "Wednesday", 4: "Thursday",
+    5: "Friday", 6: "Saturday", 7: "Sunday"
+}
+
+# Transformers preserve the frame kind: eager in -> eager out, lazy in -> lazy out
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# Vectorized equivalents of the domain validators' str.upper()/.title()/.lower() clean-ups
+_CASE_EXPRS = {
+    "upper": lambda expr: expr.str.to_uppercase(),
+    "title": lambda expr: expr.str.to_titlecase(),
+    "lower": lambda expr: expr.str.to_lowercase(),
+}
+
+
 class DataExtractor:
     """Handles data ingestion from various source formats in the Bronze layer.
     
@@ -21,21 +50,45 @@ class DataExtractor:
         """Reads a CSV file into a Polars DataFrame."""
         return pl.read_csv(file_path)
 
+    @staticmethod
+    def scan_csv(file_path: Path) -> pl.LazyFrame:
+        """Lazily scans a CSV file so projections and filters push down into the reader."""
+        return pl.scan_csv(file_path)
+
     @staticmethod
     def read_json(file_path: Path) -> pl.DataFrame:
         """Reads a JSON file into a Polars DataFrame."""
         return pl.read_json(file_path)
 
     @staticmethod
-    def extract_pdf_text(file_path: Path) -> str:
+    def extract_pdf_text(file_path: Path | IO[bytes]) -> str:
         """Extracts raw text content from a PDF file for unstructured data processing."""
         try:
             reader = PdfReader(file_path)
-            return "".join([page.extract_text() or "" for page in reader.pages])
+            return "".join(page.extract_text() or "" for page in reader.pages)
         except Exception as e:
             print(f"Error reading PDF {file_path}: {e}")
             return ""
 
+    @staticmethod
+    def extract_many(file_paths: Sequence[Path | IO[bytes]]) -> list[str]:
+        """Extracts text from several PDFs concurrently, preserving input order.
+
+        Page decompression in pypdf is zlib-bound and releases the GIL, so
+        threads overlap the I/O and inflate work of independent files.
+
+        Args:
+            file_paths (Sequence[Path | IO[bytes]]): The PDF files or binary buffers to read.
+
+        Returns:
+            list[str]: The extracted text of each file, in the same order.
+        """
+        if len(file_paths) < 2:
+            return [DataExtractor.extract_pdf_text(p) for p in file_paths]
+        workers = min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(DataExtractor.extract_pdf_text, file_paths))
+
     @staticmethod
     def convert_text_to_df(raw_text: str, header_identifier: str) -> pl.DataFrame:
         """Extracts a CSV-like block from raw text and converts it to a Polars DataFrame.
@@ -60,25 +113,48 @@ class DataTransformer:
     """
 
     @staticmethod
-    def clean_entities(df: pl.DataFrame) -> pl.DataFrame:
+    def clean_entities(df: FrameT) -> FrameT:
         """Transforms raw entity data by converting date strings to Python date objects.
 
         Args:
-            df (pl.DataFrame): The raw entity dataframe from the Bronze layer.
+            df (pl.DataFrame | pl.LazyFrame): The raw entity frame from the Bronze layer.
 
         Returns:
-            pl.DataFrame: The cleaned dataframe with proper date types.
+            pl.DataFrame | pl.LazyFrame: The cleaned frame with proper date types.
         """
-        return df.with_columns(pl.col("created_at").str.to_date())
+        # An explicit ISO format skips Polars' per-call format inference
+        return df.with_columns(pl.col("created_at").str.to_date(format="%Y-%m-%d", strict=True))
 
     @staticmethod
-    def clean_metrics(df: pl.DataFrame) -> pl.DataFrame:
+    def clean_metrics(df: FrameT) -> FrameT:
         """Ensures metric data types are correct before loading to SQL."""
         return df.with_columns([
             pl.col("cpu_usage_avg").cast(pl.Float64),
             pl.col("hourly_cost").cast(pl.Float64)
         ])
 
+    @staticmethod
+    def normalize_dim_strings(df: FrameT, rules: dict[str, str]) -> FrameT:
+        """Strips and re-cases dimension text columns in one vectorized pass.
+
+        Applies the same clean-up as the domain ``field_validator`` hooks, but
+        inside Polars, so Silver receives canonical values without a Python
+        call per cell. Columns missing from the frame are skipped.
+
+        Args:
+            df (pl.DataFrame | pl.LazyFrame): The raw dimension frame from the Bronze layer.
+            rules (dict[str, str]): Column name mapped to "upper", "title" or "lower".
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: The frame with the listed columns normalized.
+        """
+        present = df.collect_schema().names()
+        return df.with_columns([
+            _CASE_EXPRS[case](pl.col(name).str.strip_chars())
+            for name, case in rules.items()
+            if name in present
+        ])
+
 class DateDimensionGenerator:
     """Utility for generating a comprehensive Calendar Table (Date Dimension).
     Fulfills Optional Feature #1.
@@ -92,52 +168,75 @@ class DateDimensionGenerator:
         start_date = date(start_year, 1, 1)
         end_date = date(end_year, 12, 31)
 
-        # 1. Create the base date range
-        df = pl.date_range(
-            start_date,
-            end_date,
-            interval="1d",
-            eager=True
-        ).alias("date_obj").to_frame()
-
-        # 2. Generate columns including the Smart ID
-        return df.with_columns([
-            # ID: 2023-01-01 -> 20230101
-            pl.col("date_obj").dt.strftime("%Y%m%d").cast(pl.Int32).alias("id"),
-
-            pl.col("date_obj").alias("full_date"),
-            pl.col("date_obj").dt.year().alias("year"),
-            pl.col("date_obj").dt.month().alias("month"),
-            pl.col("date_obj").dt.strftime("%B").alias("month_name"),
-            pl.col("date_obj").dt.day().alias("day"),
-            pl.col("date_obj").dt.weekday().alias("day_of_week"),
-            pl.col("date_obj").dt.strftime("%A").alias("day_name"),
-            pl.col("date_obj").dt.quarter().alias("quarter"),
-            pl.col("date_obj").dt.weekday().is_in([6, 7]).alias("is_weekend")
-        ]).drop("date_obj").select([
-            "id", "full_date", "year", "month", "month_name",
-            "day", "day_of_week", "day_name", "quarter", "is_weekend"
-        ])
+        # 1. Create the base date range (lazily; nothing is materialized until collect)
+        d = pl.col("date_obj")
+        lf = pl.LazyFrame().select(
+            pl.date_range(start_date, end_date, interval="1d").alias("date_obj")
+        )
+
+        # 2. Generate columns including the Smart ID in a single fused pass
+        return lf.select([
+            # ID: 2023-01-01 -> 20230101 (integer arithmetic, no string round-trip)
+            (d.dt.year() * 10000 + d.dt.month().cast(pl.Int32) * 100 + d.dt.day().cast(pl.Int32))
+            .cast(pl.Int32).alias("id"),
+
+            d.alias("full_date"),
+            d.dt.year().alias("year"),
+            d.dt.month().alias("month"),
+            d.dt.month().replace_strict(_MONTH_NAMES, return_dtype=pl.String).alias("month_name"),
+            d.dt.day().alias("day"),
+            d.dt.weekday().alias("day_of_week"),
+            d.dt.weekday().replace_strict(_DAY_NAMES, return_dtype=pl.String).alias("day_name"),
+            d.dt.quarter().alias("quarter"),
+            d.dt.weekday().is_in([6, 7]).alias("is_weekend")
+        ]).collect()
 
 class DataLoader:
     """Handles the 'Load' phase of the ETL process."""
 
     @staticmethod
-    def load_to_sql(df: pl.DataFrame, model_class: type[SQLModel]) -> None:
+    def load_to_sql(
+        df: pl.DataFrame | pl.LazyFrame,
+        model_class: type[SQLModel],
+        session: Session | None = None
+    ) -> None:
         """Persists a Polars DataFrame into the SQL Warehouse using SQLModel.
 
         Args:
-            df (pl.DataFrame): The transformed data to load.
+            df (pl.DataFrame | pl.LazyFrame): The transformed data to load; lazy
+                pipelines are collected here, at the final step.
             model_class (Type[SQLModel]): The SQLModel class representing the target table.
+            session (Session | None): Caller-owned session to load into. When given,
+                the caller commits, so several tables can share one transaction.
+                When omitted, the load runs in its own transaction.
         
         Returns:
             None
         """
-        records = df.to_dicts()
-        if not records:
+        if isinstance(df, pl.LazyFrame):
+            df = df.collect(engine="streaming")
+        if df.is_empty():
+            return
+
+        # 1. Core inserts skip Python-side defaults, so resolve them once per load
+        defaults = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in model_class.model_fields.items()
+            if name not in df.columns and not field.is_required()
+        }
+        df = df.with_columns([
+            pl.lit(value).alias(name) for name, value in defaults.items() if value is not None
+        ])
+
+        # 2. Bulk INSERT through SQLAlchemy Core: no ORM instances or unit-of-work tracking.
+        #    Rows become dicts one slice at a time, so only a single batch is live at once.
+        table = model_class.__table__  # type: ignore[attr-defined]
+        batches = (chunk.to_dicts() for chunk in df.iter_slices(n_rows=LOAD_BATCH_SIZE))
+        if session is not None:
+            for batch in batches:
+                session.execute(insert(table), batch)
             return
 
-        with Session(engine) as session:
-            # Efficiently add all records in a single transaction
-            session.add_all([model_class(**rec) for rec in records])
-            session.commit()
+        with engine.begin() as conn:
+            for batch in batches:
+                conn.execute(insert(table), batch)
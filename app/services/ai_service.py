@@ -1,5 +1,8 @@
+import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
 
 from dotenv import load_dotenv
 from google import genai
@@ -8,6 +11,13 @@ from google import genai
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Max number of prompt -> completion pairs kept in memory
+COMPLETION_CACHE_SIZE = 1024
+
+# Process-wide: a new AIService is built for every seed run, so the cache cannot live on the instance
+_completion_cache: OrderedDict[str, str] = OrderedDict()
+_completion_cache_lock = threading.Lock()
+
 class AIService:
     def __init__(self) -> None:
         self.api_key = os.getenv("GEMINI_API_KEY")
@@ -21,6 +31,14 @@ class AIService:
         if not self.client:
             return self._fallback_logic(prompt)
 
+        # 1. Identical prompts (e.g. re-seeding the same rows) skip the network round-trip
+        key = hashlib.blake2b(f"{self.text_model}\0{prompt}".encode(), digest_size=16).hexdigest()
+        with _completion_cache_lock:
+            cached = _completion_cache.get(key)
+            if cached is not None:
+                _completion_cache.move_to_end(key)
+                return cached
+
         try:
             # SAFETY TRUNCATION:
             # Roughly 4 characters per token. 1M tokens is huge,
@@ -35,6 +53,11 @@ class AIService:
             # Fix: Ensure the return value is a string to satisfy Mypy
             # response.text can be None if the response is empty or blocked
             if response.text is not None:
+                # 2. Only real completions are cached, so fallbacks get retried later
+                with _completion_cache_lock:
+                    _completion_cache[key] = response.text
+                    if len(_completion_cache) > COMPLETION_CACHE_SIZE:
+                        _completion_cache.popitem(last=False)
                 return response.text
 
             logger.warning("AI API returned None. Triggering fallback.")
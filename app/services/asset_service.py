@@ -1,8 +1,12 @@
 import logging
+from collections.abc import Callable, Iterator, Sequence
 from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlmodel import Session, col, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, col, exists, insert, select, update
 
 # Layer 4: Data Access
 from app.data_access.models import DimAsset
@@ -13,6 +17,36 @@ from app.domain.asset import AssetDomain
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming large asset listings
+ASSET_FETCH_BATCH_SIZE = 500
+
+# Plain columns backing AssetDomain; selecting these yields light Rows, not tracked ORM objects
+_ASSET_COLUMNS = tuple(DimAsset.__table__.c[name] for name in AssetDomain.model_fields)  # type: ignore[attr-defined]
+
+# Fields the service sets itself on write; built once instead of a fresh set per model_dump call
+_MANAGED_FIELDS: set[str] = {"id", "source_timestamp", "updated_at"}
+
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING, keyed by dialect name
+_ON_CONFLICT_INSERTS: dict[str, Callable[..., Any]] = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Max keys bound into a single IN (...) clause; keeps batches clear of driver parameter limits
+IN_CLAUSE_BATCH_SIZE = 500
+
+
+def _chunk[T](seq: Sequence[T], size: int = IN_CLAUSE_BATCH_SIZE) -> Iterator[Sequence[T]]:
+    """Yields consecutive slices of ``seq`` holding at most ``size`` items.
+
+    Args:
+        seq (Sequence[T]): The keys to split.
+        size (int): The maximum slice length.
+
+    Yields:
+        Sequence[T]: The next slice of keys.
+    """
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
 class AssetService:
     """Service layer for managing Cloud Asset Infrastructure.
 
@@ -37,7 +71,7 @@ class AssetService:
         Returns:
             AssetDomain: The Pydantic domain representation.
         """
-        return AssetDomain.model_validate(db_asset)
+        return AssetDomain.from_db(db_asset)
 
     def _get_dim_asset_or_404(self, id: int) -> DimAsset:
         """Internal helper to retrieve an ACTIVE asset or raise a 404.
@@ -51,9 +85,11 @@ class AssetService:
         Raises:
             HTTPException: 404 status if the ID does not exist.
         """
-        statement = select(DimAsset).where(DimAsset.id == id, col(DimAsset.is_active))
-        asset = self.session.exec(statement).first()
-        if not asset:
+        # Primary-key lookup: served from the identity map when the row is already loaded.
+        # Pure read, so skip the autoflush pass over pending session state.
+        with self.session.no_autoflush:
+            asset = self.session.get(DimAsset, id)
+        if not asset or not asset.is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Asset with ID {id} not found."
@@ -74,9 +110,11 @@ class AssetService:
         Raises:
             HTTPException: 400 status if the center_code already exists.
         """
-        # 1. Check for existing serial number (Business Key)
-        statement = select(DimAsset).where(DimAsset.serial_number == asset_in.serial_number)
-        if self.session.exec(statement).first():
+        # 1. Check for existing serial number (Business Key) via EXISTS; no row is hydrated
+        statement = select(exists().where(col(DimAsset.serial_number) == asset_in.serial_number))
+        with self.session.no_autoflush:
+            serial_taken = self.session.scalar(statement)
+        if serial_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Asset with serial {asset_in.serial_number} already exists."
@@ -85,16 +123,17 @@ class AssetService:
         # 2. Convert Pydantic model to dict, excluding fields we want to handle manually
         # We exclude 'id' so the DB autoincrements it.
         # We exclude timestamps to ensure they are set correctly here.
-        asset_data = asset_in.model_dump(exclude={"id", "source_timestamp", "updated_at"})
+        asset_data = asset_in.model_dump(exclude=_MANAGED_FIELDS)
 
         # 3. Initialize the DB model using the unpacked dictionary
         new_db_asset = DimAsset(**asset_data)
 
-        # 4. Handle Metadata
+        # 4. Handle Metadata (one clock read shared by both fields)
+        now = datetime.now(UTC)
         # If source_timestamp isn't provided, use current UTC time.
-        new_db_asset.source_timestamp = asset_in.source_timestamp or datetime.now(UTC)
+        new_db_asset.source_timestamp = asset_in.source_timestamp or now
         # On creation, updated_at is always "now"
-        new_db_asset.updated_at = datetime.now(UTC)
+        new_db_asset.updated_at = now
 
         try:
             #6. Persist to Database
@@ -125,49 +164,92 @@ class AssetService:
         Returns:
             list[AssetDomain]: The list of created assets.
         """
-        # 1. Batch Duplicate Check (Performance Optimized)
-        # We pull all serial numbers from the input and check the DB once.
+        # 1. Prepare plain row payloads (no ORM instances to track or refresh)
+        if not data:
+            return []
         input_serials = [a.serial_number for a in data]
-        statement = select(DimAsset).where(col(DimAsset.serial_number).in_(input_serials))
-        existing_assets = self.session.exec(statement).all()
-        
-        if existing_assets:
-            existing_serials = [e.serial_number for e in existing_assets]
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Batch contains serial numbers that already exist: {existing_serials}"
-            )
-        
-        # 2. Prepare DB entries
-        db_entries = []
         now = datetime.now(UTC)
-    
-        for a in data:
-            # Use model_dump to handle all fields except metadata/id (same logic as single create)
-            entry_data = a.model_dump(exclude={"id", "source_timestamp", "updated_at"})
-            db_asset = DimAsset(**entry_data)
-            
-            # Apply metadata
-            db_asset.source_timestamp = a.source_timestamp or now
-            db_asset.updated_at = now
-            
-            db_entries.append(db_asset)
+        payload = [
+            {
+                **a.model_dump(exclude=_MANAGED_FIELDS),
+                "source_timestamp": a.source_timestamp or now,
+                "updated_at": now,
+            }
+            for a in data
+        ]
+
+        dialect = self.session.get_bind().dialect
+        on_conflict_insert = _ON_CONFLICT_INSERTS.get(dialect.name)
+
+        # 2. Batch Duplicate Check (only for dialects without ON CONFLICT support)
+        # Only the serial column is selected, in bounded IN slices merged here.
+        if on_conflict_insert is None:
+            existing_serials: list[str] = []
+            with self.session.no_autoflush:
+                for serials in _chunk(input_serials):
+                    statement = select(DimAsset.serial_number).where(col(DimAsset.serial_number).in_(serials))
+                    existing_serials.extend(self.session.exec(statement).all())
+
+            if existing_serials:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Batch contains serial numbers that already exist: {existing_serials}"
+                )
 
         try:
-            # 3. Add all entries to the session
-            self.session.add_all(db_entries)
-            
+            if on_conflict_insert is not None:
+                # 3. INSERT ... ON CONFLICT DO NOTHING RETURNING: the duplicate check and the
+                # insert are one atomic statement, so no concurrent writer can slip in between
+                stored = {}
+                for rows_slice in _chunk(payload):
+                    insert_stmt = (
+                        on_conflict_insert(DimAsset)
+                        .values(list(rows_slice))
+                        .on_conflict_do_nothing(index_elements=["serial_number"])
+                        .returning(*_ASSET_COLUMNS)
+                    )
+                    stored.update({row.serial_number: row for row in self.session.execute(insert_stmt)})
+
+                # Any serial that did not come back collided with a stored row or with
+                # an earlier entry in the same batch
+                if len(stored) != len(payload):
+                    seen: set[str] = set()
+                    existing_serials = []
+                    for serial in input_serials:
+                        if serial in stored and serial not in seen:
+                            seen.add(serial)
+                        else:
+                            existing_serials.append(serial)
+                    self.session.rollback()
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Batch contains serial numbers that already exist: {existing_serials}"
+                    )
+                rows: Sequence[Any] = [stored[serial] for serial in input_serials]
+            elif dialect.insert_executemany_returning_sort_by_parameter_order:
+                # 3b. Single INSERT ... RETURNING: generated IDs come back in the same round trip
+                insert_stmt = insert(DimAsset).returning(
+                    *DimAsset.__table__.columns, sort_by_parameter_order=True  # type: ignore[attr-defined]
+                )
+                rows = self.session.execute(insert_stmt, payload).all()
+            else:
+                # 3c. Drivers without ordered executemany RETURNING: plain bulk INSERT,
+                # then read the stored rows back by serial in input order
+                self.session.execute(insert(DimAsset), payload)
+                stored = {}
+                for serials in _chunk(input_serials):
+                    statement = select(*_ASSET_COLUMNS).where(col(DimAsset.serial_number).in_(serials))
+                    stored.update({row.serial_number: row for row in self.session.execute(statement)})
+                rows = [stored[serial] for serial in input_serials]
+
             # 4. Commit once (Atomic Transaction)
             self.session.commit()
 
-            # 5. Refresh entries to capture the IDs generated by the DB autoincrement
-            # We must refresh each one to get the ID back into the object
-            for entry in db_entries:
-                self.session.refresh(entry)
-
-            # 6. Map back to Domain objects and return
-            return [self._map_to_domain(e) for e in db_entries]
+            # 5. Map the returned rows straight to Domain objects
+            return [AssetDomain.from_db(row) for row in rows]
 
+        except HTTPException:
+            raise
         except Exception as e:
             self.session.rollback()
             logger.error(f"Batch Asset creation failed: {e!s}")
@@ -181,17 +263,20 @@ class AssetService:
         """Retrieves all assets from the database with pagination and sorting."""
         # 1. Added order_by to ensure the list doesn't "jump around" in the UI
         # 2. Added offset/limit to protect against huge data transfers
+        # 3. Column-only select: the domain fields come back as plain Rows (no ORM hydration)
         statement = (
-            select(DimAsset)
+            select(*_ASSET_COLUMNS)
             .where(col(DimAsset.is_active))
             .order_by(col(DimAsset.serial_number))
             .offset(offset)
             .limit(limit)
+            # 4. Stream rows in batches (server-side cursor on Postgres) instead of buffering all
+            .execution_options(yield_per=ASSET_FETCH_BATCH_SIZE)
         )
-        
-        results = self.session.exec(statement).all()
-        # 3. Map back to Domain objects
-        return [self._map_to_domain(a) for a in results]
+
+        # 5. Map back to Domain objects as each batch arrives (read-only: no autoflush)
+        with self.session.no_autoflush:
+            return [AssetDomain.from_db(row) for row in self.session.execute(statement)]
 
     # --- 4. get_asset ---
     def get_asset(self, id: int) -> AssetDomain:
@@ -218,7 +303,7 @@ class AssetService:
         # 2. Convert incoming Pydantic model to a dictionary
         # We exclude 'id' because we NEVER want to update the Primary Key.
         # We exclude timestamps because we handle them manually.
-        update_data = data.model_dump(exclude={"id", "source_timestamp", "updated_at"})
+        update_data = data.model_dump(exclude=_MANAGED_FIELDS)
 
         # 3. Use SQLModel's built-in update helper
         # This automatically assigns all dictionary keys to the DB object
@@ -232,7 +317,7 @@ class AssetService:
         db_asset.updated_at = datetime.now(UTC)
 
         try:
-            self.session.add(db_asset)
+            # db_asset is already tracked by the session, so commit flushes the changes directly
             self.session.commit()
             self.session.refresh(db_asset)
             
@@ -252,13 +337,16 @@ class AssetService:
     # --- 6. update_assets_batch ---
     def update_assets_batch(self, data: list[AssetDomain]) -> list[AssetDomain]:
         """Atomic batch update using serial_number as business key."""
-        # 1. Fetch all existing records in ONE query
+        # 1. Resolve serials to primary keys (only the columns we need), one bounded IN slice at a time
         input_serials = [a.serial_number for a in data]
-        statement = select(DimAsset).where(col(DimAsset.serial_number).in_(input_serials))
-        db_assets = self.session.exec(statement).all()
+        db_map: dict[str, tuple[int | None, datetime]] = {}
+        for serials in _chunk(input_serials):
+            statement = select(DimAsset.id, DimAsset.serial_number, DimAsset.source_timestamp).where(
+                col(DimAsset.serial_number).in_(serials)
+            )
 
-        # 2. Map existing assets to a dictionary for fast lookup by serial
-        db_map = {asset.serial_number: asset for asset in db_assets}
+            # 2. Map existing assets to a dictionary for fast lookup by serial
+            db_map.update({serial: (asset_id, ts) for asset_id, serial, ts in self.session.exec(statement)})
 
         # 3. Validation: Ensure all serials in the batch actually exist
         for a_data in data:
@@ -272,29 +360,26 @@ class AssetService:
 
         now = datetime.now(UTC)
 
+        # 4. Build one parameter set per asset, keyed by primary key
+        rows = []
+        for a_data in data:
+            current_id, current_timestamp = db_map[a_data.serial_number]
+            rows.append({
+                **a_data.model_dump(exclude=_MANAGED_FIELDS),
+                "id": current_id,
+                "source_timestamp": a_data.source_timestamp or current_timestamp,
+                "updated_at": now,
+            })
+
         try:
-            updated_entries = []
-            for a_data in data:
-                db_asset = db_map[a_data.serial_number]
-                
-                # 4. Use model_dump to exclude protected fields
-                update_dict = a_data.model_dump(exclude={"id", "source_timestamp", "updated_at"})
-                
-                # 5. Apply the update automatically
-                db_asset.sqlmodel_update(update_dict)
-                
-                # 6. Apply Metadata logic
-                db_asset.source_timestamp = a_data.source_timestamp or db_asset.source_timestamp
-                db_asset.updated_at = now
-                
-                self.session.add(db_asset)
-                updated_entries.append(db_asset)
+            # 5. ORM bulk UPDATE by primary key: one executemany, no per-row unit of work
+            self.session.execute(update(DimAsset), rows)
 
-            # 7. Atomic Commit
+            # 6. Atomic Commit
             self.session.commit()
-            
-            # 8. Return the refreshed list mapped back to Domain models
-            return [self._map_to_domain(e) for e in updated_entries]
+
+            # 7. The parameter sets already hold every persisted column
+            return [AssetDomain.model_construct(**row) for row in rows]
 
         except Exception as e:
             self.session.rollback()
@@ -307,30 +392,21 @@ class AssetService:
     # --- 7. delete_asset ---
     def delete_asset(self, id: int) -> None:
         """Removes a single asset by ID."""
-        # 1. Fetch the asset (raises 404 if it doesn't exist)
-        db_asset = self._get_dim_asset_or_404(id)
+        # 1. Flip the flag on the live row only; RETURNING reports whether one matched
+        statement = (
+            update(DimAsset)
+            .where(col(DimAsset.id) == id, col(DimAsset.is_active))
+            # Always update the timestamp so we know WHEN it was deactivated
+            .values(is_active=False, updated_at=datetime.now(UTC))
+            .returning(col(DimAsset.serial_number))
+        )
 
-        # Optional: Logic check - if already inactive, you might want to return early
-        if not db_asset.is_active:
-            logger.info(f"Asset {id} is already inactive.")
-            return
-            
         try:
-            # 2. Perform the "Soft-Delete" by updating flags
-            db_asset.is_active = False
-            
-            # 3. Always update the timestamp so we know WHEN it was deactivated
-            db_asset.updated_at = datetime.now(UTC)
-            
-            # 4. Save the change (Standard Update pattern)
-            self.session.add(db_asset)
+            # 2. Perform the "Soft-Delete" in a single round trip
+            serial = self.session.execute(statement).scalar_one_or_none()
             self.session.commit()
-            
-            # 5. Log for audit
-            logger.info(f"Asset with ID {id} (Serial: {db_asset.serial_number}) was deactivated (Soft-Deleted).")
-                
         except Exception as e:
-            # 6. Rollback if the update fails
+            # 3. Rollback if the update fails
             self.session.rollback()
             logger.error(f"Failed to soft-delete asset {id}: {e!s}")
             raise HTTPException(
@@ -338,6 +414,16 @@ class AssetService:
                 detail="Internal database error during asset deactivation."
             )
 
+        # 4. No row matched: the asset is missing or already inactive
+        if serial is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Asset with ID {id} not found."
+            )
+
+        # 5. Log for audit
+        logger.info(f"Asset with ID {id} (Serial: {serial}) was deactivated (Soft-Deleted).")
+
     # --- 8. delete_assets_batch (Soft-Delete) ---
     def delete_assets_batch(self, ids: list[int]) -> None:
         """Atomic batch soft-delete using efficient SQL IN operator.
@@ -350,14 +436,15 @@ class AssetService:
             return
 
         try:
-            # 2. Fetch all targeted items in one query
-            statement = select(DimAsset).where(col(DimAsset.id).in_(ids))
-            items = self.session.exec(statement).all()
+            # 2. Fetch only the matching primary keys, one bounded IN slice at a time
+            found: list[int | None] = []
+            for id_slice in _chunk(ids):
+                statement = select(DimAsset.id).where(col(DimAsset.id).in_(id_slice))
+                found.extend(self.session.exec(statement).all())
 
             # 3. Validation: Strict All-or-Nothing
-            if len(items) != len(ids):
-                found_ids = {item.id for item in items}
-                missing_ids = set(ids) - found_ids
+            if len(found) != len(ids):
+                missing_ids = set(ids) - set(found)
                 
                 logger.warning(f"Batch soft-delete failed. Missing IDs: {missing_ids}")
                 raise HTTPException(
@@ -365,17 +452,18 @@ class AssetService:
                     detail=f"Batch aborted. One or more IDs not found: {missing_ids}"
                 )
 
-            # 4. Perform the Soft-Delete
+            # 4. Perform the Soft-Delete as set-based UPDATEs sharing one timestamp
             now = datetime.now(UTC)
-            for item in items:
-                item.is_active = False
-                item.updated_at = now
-                # We add back to session to mark them as "dirty" (to be updated)
-                self.session.add(item)
+            for id_slice in _chunk(ids):
+                self.session.execute(
+                    update(DimAsset)
+                    .where(col(DimAsset.id).in_(id_slice))
+                    .values(is_active=False, updated_at=now)
+                )
 
             # 5. Atomic Commit: All are marked inactive at once
             self.session.commit()
-            logger.info(f"Successfully deactivated {len(items)} assets. IDs: {ids}")
+            logger.info(f"Successfully deactivated {len(found)} assets. IDs: {ids}")
 
         except HTTPException:
             raise
@@ -1,10 +1,20 @@
+import csv
+import io
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, cast, column, func, values
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 # Added col to satisfy Mypy strict typing on Optional fields
-from sqlmodel import Session, col, select
+from sqlmodel import Session, col, exists, insert, select, update
 
 # Layer 4: Data Access
 from app.data_access.models import DimCostCenter
@@ -15,6 +25,59 @@ from app.domain.cost_center import CostCenterDomain
 
 logger = logging.getLogger(__name__)
 
+# Fields the service sets itself on create; built once instead of a fresh set per model_dump call
+_MANAGED_FIELDS: set[str] = {"id", "source_timestamp", "updated_at"}
+
+# Rows fetched per round trip when streaming large cost center listings
+CC_FETCH_BATCH_SIZE = 500
+
+# Listing pages (keyed by limit/offset) are served from memory for this long. The cache is
+# per process and only writes made in this process invalidate it, so a write from another
+# worker can leave this one serving stale pages for up to the TTL.
+PAGE_CACHE_TTL_SECONDS = 30.0
+PAGE_CACHE_SIZE = 128
+
+# Process-wide: services are built per request, so the cache cannot live on the instance
+_page_cache: OrderedDict[tuple[int, int], tuple[float, list[CostCenterDomain]]] = OrderedDict()
+_page_cache_lock = threading.Lock()
+# Bumped on every invalidation; a read only caches its page if no write landed while it ran
+_page_cache_generation = 0
+
+# Plain columns backing CostCenterDomain; selecting these yields light Rows, not tracked ORM objects
+_CC_COLUMNS = tuple(DimCostCenter.__table__.c[name] for name in CostCenterDomain.model_fields)  # type: ignore[attr-defined]
+
+# Fixed-shape lookup built once at import and reused with a fresh bind value per call
+_CODE_EXISTS = select(exists().where(col(DimCostCenter.center_code) == bindparam("code")))
+
+# Batches at least this large are streamed through Postgres COPY instead of INSERTs
+COPY_THRESHOLD = 100
+
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING, keyed by dialect name
+_ON_CONFLICT_INSERTS: dict[str, Callable[..., Any]] = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Rows bound into one multi-row INSERT; 6 columns each keeps a statement clear of SQLite's bind-parameter limit
+INSERT_BATCH_SIZE = 500
+
+# Max keys bound into a single IN (...) clause; keeps batches clear of driver parameter limits
+IN_CLAUSE_BATCH_SIZE = 500
+
+# Columns written by COPY, in the order each CSV record carries them
+_COPY_COLUMNS = ("center_code", "department", "budget_limit", "is_active", "source_timestamp", "updated_at")
+
+# Columns a batch update takes from the input, joined on center_code
+_UPDATE_COLUMNS = ("center_code", "department", "budget_limit", "is_active", "source_timestamp")
+
+def invalidate_page_cache() -> None:
+    """Drops every cached cost center listing page.
+
+    Called after any commit that changes ``dim_cost_center``, including
+    writes made outside ``CostCenterService`` (e.g. a full re-seed).
+    """
+    global _page_cache_generation
+    with _page_cache_lock:
+        _page_cache_generation += 1
+        _page_cache.clear()
+
 class CostCenterService:
     """Service layer for managing Financial Cost Centers.
 
@@ -40,7 +103,7 @@ class CostCenterService:
         Returns:
             CostCenterDomain: The pure domain representation.
         """
-        return CostCenterDomain.model_validate(db_cc)
+        return CostCenterDomain.from_db(db_cc)
 
     def _get_dim_cc_or_404(self, id: int) -> DimCostCenter:
         """Internal helper to retrieve a cost center or raise 404.
@@ -54,15 +117,41 @@ class CostCenterService:
         Raises:
             HTTPException: 404 status if not found.
         """
-        statement = select(DimCostCenter).where(DimCostCenter.id == id, col(DimCostCenter.is_active))
-        cc = self.session.exec(statement).first()
-        if not cc:
+        # Primary-key lookup: served from the identity map when the row is already loaded
+        cc = self.session.get(DimCostCenter, id)
+        if not cc or not cc.is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Cost Center with ID {id} not found."
             )
         return cc
 
+    def _bulk_copy(self, rows: list[dict[str, Any]]) -> None:
+        """Streams rows into the cost center table with a single Postgres COPY.
+
+        COPY validates and writes the whole buffer in one pass, skipping the
+        per-statement overhead of individual INSERTs. It runs on the session's
+        own connection, so it commits or rolls back with the rest of the batch.
+
+        Args:
+            rows (list[dict[str, Any]]): Column values keyed by the ``_COPY_COLUMNS`` names.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([row[name] for name in _COPY_COLUMNS] for row in rows)
+        buffer.seek(0)
+
+        table = DimCostCenter.__table__.fullname  # type: ignore[attr-defined]
+        # CSV mode reads an unquoted empty field as NULL; keep empty strings as strings
+        copy_sql = (
+            f"COPY {table} ({', '.join(_COPY_COLUMNS)}) FROM STDIN "
+            "WITH (FORMAT csv, FORCE_NOT_NULL (center_code, department))"
+        )
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(copy_sql, buffer)
+        finally:
+            cursor.close()
+
     # --- 1. create_cost_center ---
     def create_cost_center(self, cc_in: CostCenterDomain) -> CostCenterDomain:
         """Validates and persists a new cost center.
@@ -76,9 +165,8 @@ class CostCenterService:
         Raises:
             HTTPException: 400 status if the center_code already exists.
         """
-        # 1. Unique Constraint Check
-        statement = select(DimCostCenter).where(DimCostCenter.center_code == cc_in.center_code)
-        if self.session.exec(statement).first():
+        # 1. Unique Constraint Check via EXISTS; no row is hydrated
+        if self.session.scalar(_CODE_EXISTS, {"code": cc_in.center_code}):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cost Center code '{cc_in.center_code}' is already registered."
@@ -87,27 +175,27 @@ class CostCenterService:
         # 2. Convert Pydantic model to dict, excluding fields we want to handle manually
         # We exclude 'id' so the DB autoincrements it.
         # We exclude timestamps to ensure they are set correctly here.
-        cc_data = cc_in.model_dump(exclude={"id", "source_timestamp", "updated_at"})
+        cc_data = cc_in.model_dump(exclude=_MANAGED_FIELDS)
 
-        # 3. Initialize the DB model using the unpacked dictionary
-        new_cc = DimCostCenter(**cc_data)
-
-        # 4. Handle Metadata
+        # 3. Handle Metadata (one clock read shared by both fields)
+        now = datetime.now(UTC)
         # If source_timestamp isn't provided, use current UTC time.
-        new_cc.source_timestamp = cc_in.source_timestamp or datetime.now(UTC)
+        cc_data["source_timestamp"] = cc_in.source_timestamp or now
         # On creation, updated_at is always "now"
-        new_cc.updated_at = datetime.now(UTC)
+        cc_data["updated_at"] = now
 
         try:
-            # 5. Persist to Database
-            self.session.add(new_cc)
+            # 4. Single INSERT ... RETURNING: the autoincremented ID comes back with the
+            # insert itself, so no refresh SELECT is needed
+            insert_stmt = insert(DimCostCenter).values(cc_data).returning(
+                *DimCostCenter.__table__.columns  # type: ignore[attr-defined]
+            )
+            created = self.session.execute(insert_stmt).one()
             self.session.commit()
+            invalidate_page_cache()
 
-            # 6. Refresh to get the Autoincremented ID from the DB
-            self.session.refresh(new_cc)
-
-            # 7. Return the Domain representation
-            return self._map_to_domain(new_cc)
+            # 5. Return the Domain representation
+            return CostCenterDomain.from_db(created)
         except Exception as e:
             self.session.rollback()
             logger.error(f"Failed to create cost center: {e}")
@@ -127,54 +215,108 @@ class CostCenterService:
         Returns:
             List[CostCenterDomain]: The list of created centers.
         """
-        # 1. Batch Duplicate Check (Performance Optimized)
-        # We check if any of the incoming center_codes already exist in the DB.
+        # 1. Prepare plain row payloads: the whole batch is serialized in one adapter pass,
+        # which also picks up any field added to the model later
         input_codes = [cc.center_code for cc in ccs_in]
-        statement = select(DimCostCenter).where(col(DimCostCenter.center_code).in_(input_codes))
-        existing_ccs = self.session.exec(statement).all()
-        
-        if existing_ccs:
-            existing_codes = [e.center_code for e in existing_ccs]
+
+        # Repeated codes within the batch are rejected up front in one O(n) pass,
+        # before any database work (the INSERT would otherwise fail part-way)
+        seen: set[str] = set()
+        duplicate_codes: list[str] = []
+        for code in input_codes:
+            if code in seen:
+                duplicate_codes.append(code)
+            seen.add(code)
+        if duplicate_codes:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Batch contains Cost Center codes that already exist: {existing_codes}"
+                detail=f"Batch contains duplicate Cost Center codes: {duplicate_codes}"
             )
-    
-        # 2. Prepare DB entries
-        db_entries = []
+
         now = datetime.now(UTC)
+        dumped = CostCenterDomain.list_adapter().dump_python(ccs_in, exclude={"__all__": _MANAGED_FIELDS})
+        rows = [
+            {**data, "source_timestamp": cc.source_timestamp or now, "updated_at": now}
+            for cc, data in zip(ccs_in, dumped, strict=True)
+        ]
+        if not rows:
+            return []
+
+        dialect_name = self.session.get_bind().dialect.name
+        use_copy = len(rows) >= COPY_THRESHOLD and dialect_name == "postgresql"
+        on_conflict_insert = None if use_copy else _ON_CONFLICT_INSERTS.get(dialect_name)
+
+        # 2. Batch Duplicate Check (only when the write itself cannot report conflicts)
+        if on_conflict_insert is None:
+            existing_codes: list[str] = []
+            for start in range(0, len(input_codes), IN_CLAUSE_BATCH_SIZE):
+                statement = select(DimCostCenter.center_code).where(
+                    col(DimCostCenter.center_code).in_(input_codes[start:start + IN_CLAUSE_BATCH_SIZE])
+                )
+                existing_codes.extend(self.session.exec(statement).all())
 
-        for cc in ccs_in:
-            # Use model_dump to handle all fields, excluding metadata and ID
-            # This ensures that if you add 'manager' or 'location' to the model later,
-            # this code doesn't need to change.
-            entry_data = cc.model_dump(exclude={"id", "source_timestamp", "updated_at"})
-            db_cc = DimCostCenter(**entry_data)
-            
-            # Apply standard metadata
-            # (Assuming DimCostCenter follows the same metadata pattern as DimAsset)
-            if hasattr(db_cc, "source_timestamp"):
-                db_cc.source_timestamp = getattr(cc, "source_timestamp", None) or now
-            if hasattr(db_cc, "updated_at"):
-                db_cc.updated_at = now
-                
-            db_entries.append(db_cc)
+            if existing_codes:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Batch contains Cost Center codes that already exist: {existing_codes}"
+                )
 
         try:
-            # 3. Add all to session
-            self.session.add_all(db_entries)
-            
+            if use_copy:
+                # 3a. Large batches on Postgres: one COPY, then read the generated IDs back by code
+                # as plain column rows, in bounded IN slices
+                self._bulk_copy(rows)
+                stored = {}
+                for start in range(0, len(input_codes), IN_CLAUSE_BATCH_SIZE):
+                    stored_statement = select(*_CC_COLUMNS).where(
+                        col(DimCostCenter.center_code).in_(input_codes[start:start + IN_CLAUSE_BATCH_SIZE])
+                    )
+                    stored.update(
+                        {row.center_code: CostCenterDomain.from_db(row) for row in self.session.execute(stored_statement)}
+                    )
+            elif on_conflict_insert is not None:
+                # 3. INSERT ... ON CONFLICT DO NOTHING RETURNING: the uniqueness check is an index
+                # probe inside the insert itself, so there is no separate duplicate-check query
+                stored = {}
+                for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                    insert_stmt = (
+                        on_conflict_insert(DimCostCenter)
+                        .values(rows[start:start + INSERT_BATCH_SIZE])
+                        .on_conflict_do_nothing(index_elements=["center_code"])
+                        .returning(*DimCostCenter.__table__.columns)  # type: ignore[attr-defined]
+                    )
+                    stored.update(
+                        {row.center_code: CostCenterDomain.from_db(row) for row in self.session.execute(insert_stmt)}
+                    )
+
+                # Codes are unique within the batch, so any code that did not come back
+                # collided with a stored row
+                if len(stored) != len(rows):
+                    existing_codes = [code for code in input_codes if code not in stored]
+                    self.session.rollback()
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Batch contains Cost Center codes that already exist: {existing_codes}"
+                    )
+            else:
+                # 3b. Single INSERT ... RETURNING: generated IDs come back with the insert itself,
+                # so no per-row refresh is needed afterwards
+                insert_stmt = insert(DimCostCenter).returning(
+                    *DimCostCenter.__table__.columns, sort_by_parameter_order=True  # type: ignore[attr-defined]
+                )
+                stored = {
+                    row.center_code: CostCenterDomain.from_db(row) for row in self.session.execute(insert_stmt, rows)
+                }
+
             # 4. Atomic Transaction: All succeed or all fail
             self.session.commit()
+            invalidate_page_cache()
 
-            # 5. Refresh to capture Autoincremented IDs
-            for entry in db_entries:
-                self.session.refresh(entry)
-
-            # 6. Map back to Domain objects (assuming you have a _map_to_domain helper for CCs)
-            # If you don't have a helper, you can use: CostCenterDomain.model_validate(e)
-            return [CostCenterDomain.model_validate(e) for e in db_entries]
+            # 5. Return the Domain objects in input order
+            return [stored[code] for code in input_codes]
 
+        except HTTPException:
+            raise
         except Exception as e:
             self.session.rollback()
             logger.error(f"Batch Cost Center load failed: {e!s}")
@@ -198,20 +340,40 @@ class CostCenterService:
         Returns:
             list[CostCenterDomain]: A list of cost center domain representations.
         """
-        # 1. Added order_by (Sorting by center_code is usually best for Cost Centers)
-        # 2. Added limit/offset to prevent data overloads
+        # 1. Serve repeated dropdown/table pages from the process cache while still fresh
+        key = (limit, offset)
+        with _page_cache_lock:
+            cached = _page_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < PAGE_CACHE_TTL_SECONDS:
+                _page_cache.move_to_end(key)
+                return list(cached[1])
+            generation = _page_cache_generation
+
+        # 2. Added order_by (Sorting by center_code is usually best for Cost Centers)
+        # 3. Added limit/offset to prevent data overloads
+        # 4. Column-only select: plain Rows come back, with no ORM hydration or identity-map work
         statement = (
-            select(DimCostCenter)
+            select(*_CC_COLUMNS)
             .where(col(DimCostCenter.is_active))
             .order_by(col(DimCostCenter.center_code))
             .offset(offset)
             .limit(limit)
+            # 5. Stream rows in batches (server-side cursor on Postgres) instead of buffering all
+            .execution_options(yield_per=CC_FETCH_BATCH_SIZE)
         )
-        
-        results = self.session.exec(statement).all()
-        
-        # 3. Use the mapping helper for consistency
-        return [self._map_to_domain(cc) for cc in results]
+
+        # 6. Trusted DB rows map straight across via model_construct as each batch arrives
+        page = [CostCenterDomain.from_db(row) for row in self.session.execute(statement)]
+
+        # 7. Remember the page, unless a write was committed (and invalidated) while it was read
+        with _page_cache_lock:
+            if generation != _page_cache_generation:
+                return list(page)
+            _page_cache[key] = (time.monotonic(), page)
+            _page_cache.move_to_end(key)
+            if len(_page_cache) > PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+        return list(page)
 
     # --- 4. get_cost_center ---
     def get_cost_center(self, id: int) -> CostCenterDomain:
@@ -251,13 +413,13 @@ class CostCenterService:
 
         # 4. Update Metadata
         # On every update, we refresh the updated_at timestamp
-        if hasattr(db_cc, "updated_at"):
-            db_cc.updated_at = datetime.now(UTC)
+        db_cc.updated_at = datetime.now(UTC)
 
         try:
             # 5. Persist changes
             self.session.add(db_cc)
             self.session.commit()
+            invalidate_page_cache()
             
             # 6. Refresh to get the latest state from DB
             self.session.refresh(db_cc)
@@ -287,51 +449,81 @@ class CostCenterService:
         Returns:
             List[CostCenterDomain]: The original input list on success.
         """
-        # 1. Fetch all existing Cost Centers in ONE query (Performance Optimization)
-        input_codes = [cc.center_code for cc in ccs_in]
-        statement = select(DimCostCenter).where(col(DimCostCenter.center_code).in_(input_codes))
-        db_ccs = self.session.exec(statement).all()
-
-        # 2. Map existing CCs to a dictionary for O(1) fast lookup by center_code
-        db_map = {cc.center_code: cc for cc in db_ccs}
-
-        # 3. Pre-validation: Ensure all center_codes in the batch actually exist
-        for cc_data in ccs_in:
-            if cc_data.center_code not in db_map:
-                # We haven't changed data yet, but we rollback to stay safe
-                self.session.rollback()
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Cost Center code '{cc_data.center_code}' not found. Batch aborted."
-                )
-            
-        now = datetime.now(UTC)
+        if not ccs_in:
+            return []
+        use_values_join = self.session.get_bind().dialect.name == "postgresql"
+        matched: dict[str, Any]
 
         try:
-            updated_entries = []
+            if use_values_join:
+                # 1. Stage every incoming row as an inline VALUES table keyed by center_code
+                columns = DimCostCenter.__table__.c  # type: ignore[attr-defined]
+                incoming = values(
+                    *(column(name, columns[name].type) for name in _UPDATE_COLUMNS), name="incoming"
+                ).data([tuple(getattr(cc_data, name) for name in _UPDATE_COLUMNS) for cc_data in ccs_in])
+
+                # 2. One UPDATE ... FROM (VALUES ...) joins the batch against the table;
+                # RETURNING reports which codes matched, so no pre-fetch SELECT is needed
+                statement = (
+                    update(DimCostCenter)
+                    .where(col(DimCostCenter.center_code) == incoming.c.center_code)
+                    .values(
+                        {name: incoming.c[name] for name in _UPDATE_COLUMNS if name != "center_code"}
+                        # The column is NOT NULL: an omitted timestamp keeps the stored one. The cast
+                        # stops Postgres typing an all-NULL VALUES column as text.
+                        | {
+                            "source_timestamp": func.coalesce(
+                                cast(incoming.c.source_timestamp, columns["source_timestamp"].type),
+                                DimCostCenter.source_timestamp,
+                            )
+                        }
+                        # Stamped server-side; RETURNING hands the value back
+                        | {"updated_at": func.now()}
+                    )
+                    .returning(*columns)
+                    .execution_options(synchronize_session=False)
+                )
+                matched = {row.center_code: CostCenterDomain.from_db(row) for row in self.session.execute(statement)}
+            else:
+                # 1b. Other dialects: resolve center codes to primary keys (only the columns we need);
+                # the stored timestamp backs rows that omit one
+                input_codes = [cc.center_code for cc in ccs_in]
+                key_statement = select(
+                    DimCostCenter.id, DimCostCenter.center_code, DimCostCenter.source_timestamp
+                ).where(col(DimCostCenter.center_code).in_(input_codes))
+                matched = {code: (cc_id, stored_ts) for cc_id, code, stored_ts in self.session.exec(key_statement)}
+
+            # 3. Validation: every center_code in the batch must have matched a row
             for cc_data in ccs_in:
-                db_cc = db_map[cc_data.center_code]
-                
-                # 4. Use model_dump to extract data, excluding protected fields
-                # We exclude 'id' to protect the primary key
-                update_dict = cc_data.model_dump(exclude={"id", "updated_at"})
-                
-                # 5. Apply the update automatically using SQLModel's helper
-                db_cc.sqlmodel_update(update_dict)
-                
-                # 6. Apply Metadata logic
-                if hasattr(db_cc, "updated_at"):
-                    db_cc.updated_at = now
-                
-                self.session.add(db_cc)
-                updated_entries.append(db_cc)
-
-            # 7. Atomic Commit: All records are updated in a single transaction
+                if cc_data.center_code not in matched:
+                    self.session.rollback()
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Cost Center code '{cc_data.center_code}' not found. Batch aborted."
+                    )
+
+            if not use_values_join:
+                # 2b. ORM bulk UPDATE by primary key: one executemany, no per-row unit of work
+                now = datetime.now(UTC)
+                rows = []
+                for cc_data in ccs_in:
+                    cc_id, stored_ts = matched[cc_data.center_code]
+                    rows.append(
+                        {name: getattr(cc_data, name) for name in _UPDATE_COLUMNS}
+                        | {"id": cc_id, "source_timestamp": cc_data.source_timestamp or stored_ts, "updated_at": now}
+                    )
+                self.session.execute(update(DimCostCenter), rows)
+                matched = {row["center_code"]: CostCenterDomain.model_construct(**row) for row in rows}
+
+            # 4. Atomic Commit: All records are updated in a single transaction
             self.session.commit()
-            
-            # 8. Map back to Domain models to return fresh data (including IDs/Timestamps)
-            return [self._map_to_domain(e) for e in updated_entries]
+            invalidate_page_cache()
+
+            # 5. Return the updated Domain models in input order
+            return [matched[cc_data.center_code] for cc_data in ccs_in]
 
+        except HTTPException:
+            raise
         except Exception as e:
             self.session.rollback()
             logger.error(f"Batch Cost Center update failed: {e!s}")
@@ -359,6 +551,7 @@ class CostCenterService:
             # 3. Save the change
             self.session.add(db_cc)
             self.session.commit()
+            invalidate_page_cache()
             
             logger.info(f"Cost Center {id} was deactivated (Soft-Deleted).")
             
@@ -379,16 +572,20 @@ class CostCenterService:
             return
 
         try:
-            # 2. Fetch all targeted cost centers in one query
-            # Use col() to ensure Mypy handles the Optional ID field correctly
-            statement = select(DimCostCenter).where(col(DimCostCenter.id).in_(ids))
-            items = self.session.exec(statement).all()
-
-            # 3. Validation: Strict All-or-Nothing
-            if len(items) != len(ids):
-                found_ids = {item.id for item in items if item.id is not None}
+            # 2. Soft-delete every targeted row in one UPDATE; RETURNING reports which IDs matched
+            statement = (
+                update(DimCostCenter)
+                .where(col(DimCostCenter.id).in_(ids))
+                # Stamped server-side: nothing is returned that needs the value in Python
+                .values(is_active=False, updated_at=func.now())
+                .returning(col(DimCostCenter.id))
+            )
+            found_ids = set(self.session.execute(statement).scalars())
+
+            # 3. Validation: Strict All-or-Nothing (undo the UPDATE if any ID is missing)
+            if len(found_ids) != len(set(ids)):
                 missing_ids = set(ids) - found_ids
-                
+
                 logger.warning(f"Batch soft-delete failed. Missing Cost Center IDs: {missing_ids}")
                 self.session.rollback()
                 raise HTTPException(
@@ -396,20 +593,10 @@ class CostCenterService:
                     detail=f"Batch aborted. One or more Cost Center IDs not found: {list(missing_ids)}"
                 )
 
-            # 4. Perform the Soft-Delete
-            now = datetime.now(UTC)
-            for item in items:
-                item.is_active = False
-                # If your DimCostCenter model has an updated_at field:
-                if hasattr(item, "updated_at"):
-                    item.updated_at = now
-                
-                # Add back to session to mark as modified
-                self.session.add(item)
-
-            # 5. Atomic Commit: All are deactivated at once
+            # 4. Atomic Commit: All are deactivated at once
             self.session.commit()
-            logger.info(f"Successfully deactivated {len(items)} cost centers. IDs: {ids}")
+            invalidate_page_cache()
+            logger.info(f"Successfully deactivated {len(found_ids)} cost centers. IDs: {ids}")
 
         except HTTPException:
             # Re-raise the 404 error
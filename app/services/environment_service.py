@@ -38,7 +38,7 @@ class EnvironmentService:
         Returns:
             EnvironmentDomain: The Pydantic domain representation.
         """
-        return EnvironmentDomain.model_validate(db_env)
+        return EnvironmentDomain.from_db(db_env)
 
     def _get_dim_env_or_404(self, id: int) -> DimEnvironment:
         """Internal helper to retrieve an active environment or raise 404.
@@ -38,7 +38,7 @@ class HardwareProfileService:
         Returns:
             HardwareProfileDomain: The Pydantic domain representation.
         """
-        return HardwareProfileDomain.model_validate(db_profile)
+        return HardwareProfileDomain.from_db(db_profile)
 
     def _get_dim_profile_or_404(self, id: int) -> DimHardwareProfile:
         """Internal helper to retrieve an active hardware profile or raise 404.
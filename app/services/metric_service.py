@@ -38,7 +38,7 @@ class MetricService:
         Returns:
             MetricEntryDomain: The Pydantic domain representation.
         """
-        return MetricEntryDomain.model_validate(db_obj)
+        return MetricEntryDomain.from_db(db_obj)
 
     def _get_dim_metric_or_404(self, id: int) -> MetricEntry:
         """Internal helper to retrieve a metric entry or raise a 404 error.
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 from fastapi import HTTPException, status
@@ -37,7 +38,7 @@ class ProviderService:
         Returns:
             ProviderDomain: The Pydantic domain representation.
         """
-        return ProviderDomain.model_validate(db_prov)
+        return ProviderDomain.from_db(db_prov)
 
     def _get_dim_provider_or_404(self, id: int) -> DimProvider:
         """Internal helper to retrieve an active provider or raise 404.
@@ -109,11 +110,11 @@ class ProviderService:
             )
 
     # --- 2. create_providers_batch ---
-    def create_providers_batch(self, providers_in: list[ProviderDomain]) -> list[ProviderDomain]:
+    def create_providers_batch(self, providers_in: Sequence[ProviderDomain]) -> list[ProviderDomain]:
         """Requirement: Batch CRUD. Ingests multiple providers in one transaction.
 
         Args:
-            providers_in (list[ProviderDomain]): List of provider objects.
+            providers_in (Sequence[ProviderDomain]): List of provider objects.
 
         Returns:
             list[ProviderDomain]: The list of created providers.
@@ -231,11 +232,11 @@ class ProviderService:
             )
 
     # --- 6. update_providers_batch ---
-    def update_providers_batch(self, data: list[ProviderDomain]) -> list[ProviderDomain]:
+    def update_providers_batch(self, data: Sequence[ProviderDomain]) -> list[ProviderDomain]:
         """Requirement: Batch CRUD. Updates multiple providers using 'provider_name'.
 
         Args:
-            data (list[ProviderDomain]): Updated provider data list.
+            data (Sequence[ProviderDomain]): Updated provider data list.
 
         Returns:
             list[ProviderDomain]: Refreshed list of updated entities.
@@ -38,7 +38,7 @@ class RegionService:
         Returns:
             RegionDomain: The Pydantic domain representation.
         """
-        return RegionDomain.model_validate(db_obj)
+        return RegionDomain.from_db(db_obj)
 
     def _get_dim_region_or_404(self, id: int) -> DimRegion:
         """Internal helper to retrieve an active region or raise 404.
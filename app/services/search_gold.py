@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 from sqlmodel import Session, select
 
 # Layer 4: Data Access
@@ -35,16 +36,7 @@ class GoldSearchService:
 
     def _map_to_metric_context(self, db_obj: FactAssetMetricsMView) -> AssetMetricContext:
         """Safe mapping for wide metric context."""
-        return AssetMetricContext.model_validate(db_obj.model_dump())
-
-    def _map_to_utilization(self, db_obj: AssetUtilizationMView) -> AssetUtilization:
-        return AssetUtilization.model_validate(db_obj.model_dump())
-
-    def _map_to_team_cost(self, db_obj: TeamCostMView) -> TeamCost:
-        return TeamCost.model_validate(db_obj.model_dump())
-
-    def _map_to_security(self, db_obj: SecurityComplianceMView) -> SecurityCompliance:
-        return SecurityCompliance.model_validate(db_obj.model_dump())
+        return AssetMetricContext.model_validate(db_obj)
 
     def _map_to_efficiency(self, db_obj: ResourceEfficiencyMView) -> ResourceEfficiency:
         return ResourceEfficiency.model_validate(db_obj.model_dump())
@@ -66,12 +58,19 @@ class GoldSearchService:
             
             results = self.session.exec(statement).all()
 
+            try:
+                # 1. Fast path: the whole result set is validated in a single call
+                return AssetMetricContext.list_adapter().validate_python(results)
+            except ValidationError:
+                # The view is a 10-way LEFT JOIN, so NULL dimensions or out-of-range metrics can appear
+                logger.warning("Batch validation failed for fact_asset_metrics, retrying per row.")
+
+            # 2. Row-by-row fallback so one bad record doesn't drop the whole response
             final_list = []
             for r in results:
                 try:
-                    # Handles SQLModel -> Pydantic conversion per row
                     final_list.append(self._map_to_metric_context(r))
-                except Exception as map_err:
+                except ValidationError as map_err:
                     # Prevents a single corrupt row from failing the entire API request
                     logger.warning(f"Skipping malformed metric record (ID: {getattr(r, 'id', 'Unknown')}): {map_err}")
                     continue
@@ -97,7 +96,7 @@ class GoldSearchService:
                 statement = statement.where(AssetUtilizationMView.provider_name == provider_name)
 
             results = self.session.exec(statement).all()
-            return [self._map_to_utilization(r) for r in results]
+            return AssetUtilization.list_adapter().validate_python([r.model_dump() for r in results])
         except Exception as e:
             logger.error(f"Error in search_assets_utilization: {e}")
             raise HTTPException(
@@ -110,7 +109,7 @@ class GoldSearchService:
         try:
             statement = select(TeamCostMView)
             results = self.session.exec(statement).all()
-            return [self._map_to_team_cost(r) for r in results]
+            return TeamCost.list_adapter().validate_python([r.model_dump() for r in results])
         except Exception as e:
             logger.error(f"Error fetching team cost report: {e}")
             raise HTTPException(
@@ -123,7 +122,7 @@ class GoldSearchService:
         try:
             statement = select(SecurityComplianceMView)
             results = self.session.exec(statement).all()
-            return [self._map_to_security(r) for r in results]
+            return SecurityCompliance.list_adapter().validate_python([r.model_dump() for r in results])
         except Exception as e:
             logger.error(f"Error fetching security risks: {e}")
             raise HTTPException(
@@ -38,7 +38,7 @@ class SecurityTierService:
         Returns:
             SecurityTierDomain: The Pydantic domain representation.
         """
-        return SecurityTierDomain.model_validate(db_obj)
+        return SecurityTierDomain.from_db(db_obj)
 
     def _get_dim_tier_or_404(self, id: int) -> DimSecurityTier:
         """Internal helper to retrieve an active security tier or raise 404.
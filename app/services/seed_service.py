@@ -2,9 +2,10 @@ import io
 import logging
 import re
 from datetime import UTC, date, datetime
-from typing import Any
+from typing import Any, Final
 
 import polars as pl
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, SQLModel, create_engine, delete, select, text
 from supabase import Client, create_client
@@ -42,12 +43,27 @@ from app.domain.status import StatusDomain
 from app.domain.team import TeamDomain
 
 # Layer 2: ETL & Services
-from app.etl.pipeline import DataExtractor, DateDimensionGenerator
+from app.etl.pipeline import DataExtractor, DataTransformer, DateDimensionGenerator
 from app.services.ai_service import AIService
+from app.services.cost_center_service import invalidate_page_cache
 from app.services.search_service import SearchService
 
 logger = logging.getLogger(__name__)
 
+# Text clean-ups per Bronze table, mirroring the domain validators; applied in
+# Polars so Silver holds canonical values (env_name is left to its alias map).
+_DIM_STRING_RULES: Final[dict[str, dict[str, str]]] = {
+    "assets": {"serial_number": "upper", "resource_name": "title"},
+    "cost_centers": {"center_code": "upper"},
+    "hardware_profiles": {"profile_name": "lower"},
+    "providers": {"provider_name": "upper", "provider_type": "title"},
+    "regions": {"region_code": "lower"},
+    "security_tiers": {"tier_name": "title"},
+    "service_types": {"service_name": "upper", "category": "title"},
+    "statuses": {"status_name": "upper"},
+    "teams": {"team_name": "title", "department": "title"},
+}
+
 class SeedService:
     """Orchestration service for the Medallion Data Pipeline.
     
@@ -110,6 +126,9 @@ class SeedService:
         except Exception as e:
             logger.error(f"❌ Pipeline failed: {e!s}")
             return {"status": "error", "message": str(e)}
+        finally:
+            # Silver tables were dropped and reloaded with new IDs, even if a later phase failed
+            invalidate_page_cache()
 
     def _cleanup_database(self) -> None:
         """Requirement: Drop all tables by dropping and recreating schemas."""
@@ -152,12 +171,14 @@ class SeedService:
             logger.error(f"❌ Could not access Supabase path {self.bronze_folder}: {e}")
             return
 
+        # 2. Download every file first, so the PDFs can be parsed in one concurrent pass
+        downloads: list[tuple[str, str, io.BytesIO]] = []
         for file_info in storage_files:
             file_name = file_info['name']
             if file_name == ".emptyFolderPlaceholder":
                 continue
 
-            # 2. Extract Table Name and Extension
+            # Extract Table Name and Extension
             file_stem = file_name.rsplit('.', 1)[0]
             extension = f".{file_name.rsplit('.', 1)[-1].lower()}"
             table_parts = re.split(r'_\d{4}_', file_stem)
@@ -165,23 +186,28 @@ class SeedService:
 
             logger.info(f"📥 Landing {file_name} -> bronze.{table_name}")
 
-            # 3. Download to memory buffer
+            # Download to memory buffer
             try:
                 full_storage_path = f"{self.bronze_folder}/{file_name}"
                 file_bytes = self.supabase.storage.from_(self.bucket_name).download(full_storage_path)
-                file_buffer = io.BytesIO(file_bytes)
+                downloads.append((table_name, extension, io.BytesIO(file_bytes)))
             except Exception as e:
                 logger.error(f"❌ Failed download for {file_name}: {e}")
                 continue
 
+        # 3. Extract PDF text across threads; results come back in download order
+        pdf_texts = iter(DataExtractor.extract_many(
+            [buffer for _, extension, buffer in downloads if extension == ".pdf"]
+        ))
+
+        for table_name, extension, file_buffer in downloads:
             # 4. Extract data using Polars
             if extension == ".csv":
                 df = DataExtractor.read_csv(file_buffer)
             elif extension == ".json":
                 df = DataExtractor.read_json(file_buffer)
             elif extension == ".pdf":
-                raw_text = DataExtractor.extract_pdf_text(file_buffer)
-                df = DataExtractor.convert_text_to_df(raw_text, "provider_name")
+                df = DataExtractor.convert_text_to_df(next(pdf_texts), "provider_name")
             else:
                 continue
 
@@ -223,6 +249,7 @@ class SeedService:
             df = pl.read_database(query=query, connection=self.engine)
             
             # 2. Standardization and Upsert to Silver Layer
+            df = DataTransformer.normalize_dim_strings(df, _DIM_STRING_RULES.get(bronze_table, {}))
             self._upsert_polars_to_silver(df, sql_model, u_key)
 
             # 3. Pull fresh Silver data for Search Sync
@@ -235,10 +262,9 @@ class SeedService:
         logger.info(f"🔍 Syncing {collection_name} to Typesense...")
         records = df.to_dicts()
 
-        for record in records:
+        # 1. Validate through Pydantic Domain Layer
+        for domain_obj in self._validate_records(records, domain_model, collection_name):
             try:
-                # 1. Validate through Pydantic Domain Layer
-                domain_obj = domain_model.model_validate(record)
                 doc = domain_obj.model_dump()
 
                 # 2. Format for Typesense (IDs as strings, Dates as Unix Timestamps)
@@ -252,7 +278,27 @@ class SeedService:
                 # 3. Perform indexing
                 self.search_service.index_asset(collection_name, doc)
             except Exception as e:
+                logger.error(f"⚠️ Indexing skipped for {collection_name}: {e}")
+
+    def _validate_records(
+        self, records: list[dict[str, Any]], domain_model: Any, collection_name: str
+    ) -> list[Any]:
+        """Validates Silver rows into Domain objects, skipping malformed records."""
+        adapter: TypeAdapter[list[Any]] = domain_model.list_adapter()
+        try:
+            # 1. Fast path: the whole batch is validated in a single call
+            return adapter.validate_python(records)
+        except ValidationError:
+            logger.warning(f"⚠️ Batch validation failed for {collection_name}, retrying per row.")
+
+        # 2. Row-by-row fallback so one bad record doesn't drop the whole batch
+        valid_objs = []
+        for record in records:
+            try:
+                valid_objs.append(domain_model.model_validate(record))
+            except ValidationError as e:
                 logger.error(f"⚠️ Validation skipped for {collection_name}: {e}")
+        return valid_objs
 
     def _upsert_polars_to_silver(self, df: pl.DataFrame, model: Any, unique_col: str) -> None:
         """Standard SQL UPSERT logic with automated metadata handling."""
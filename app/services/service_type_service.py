@@ -38,7 +38,7 @@ class ServiceTypeService:
         Returns:
             ServiceTypeDomain: The Pydantic domain representation.
         """
-        return ServiceTypeDomain.model_validate(db_service)
+        return ServiceTypeDomain.from_db(db_service)
 
     def _get_dim_service_or_404(self, id: int) -> DimServiceType:
         """Internal helper to retrieve an active service record or raise a 404 error.
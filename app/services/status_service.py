@@ -38,7 +38,7 @@ class StatusService:
         Returns:
             StatusDomain: The Pydantic domain representation.
         """
-        return StatusDomain.model_validate(db_status)
+        return StatusDomain.from_db(db_status)
 
     def _get_dim_status_or_404(self, id: int) -> DimStatus:
         """Internal helper to retrieve an active status or raise 404.
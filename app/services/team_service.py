@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 from fastapi import HTTPException, status
@@ -38,7 +39,7 @@ class TeamService:
         Returns:
             TeamDomain: The Pydantic domain representation.
         """
-        return TeamDomain.model_validate(db_team)
+        return TeamDomain.from_db(db_team)
 
     def _get_dim_team_or_404(self, id: int) -> DimTeam:
         """Internal helper to retrieve an active team or raise 404.
@@ -110,11 +111,11 @@ class TeamService:
             )
 
     # --- 2. create_teams_batch ---
-    def create_teams_batch(self, teams_in: list[TeamDomain]) -> list[TeamDomain]:
+    def create_teams_batch(self, teams_in: Sequence[TeamDomain]) -> list[TeamDomain]:
         """Requirement: Batch CRUD. Ingests multiple teams in one transaction.
 
         Args:
-            teams_in (list[TeamDomain]): List of team objects.
+            teams_in (Sequence[TeamDomain]): List of team objects.
 
         Returns:
             list[TeamDomain]: The list of created teams.
@@ -243,12 +244,12 @@ class TeamService:
             )
 
     # --- 6. update_teams_batch ---
-    def update_teams_batch(self, teams_in: list[TeamDomain]) -> list[TeamDomain]:
+    def update_teams_batch(self, teams_in: Sequence[TeamDomain]) -> list[TeamDomain]:
         """Requirement: CRUD batch operations.
         Updates multiple teams using 'team_name' as the business key.
 
         Args:
-            teams_in (list[TeamDomain]): Updated team data list.
+            teams_in (Sequence[TeamDomain]): Updated team data list.
 
         Returns:
             list[TeamDomain]: Refreshed list of updated entities.
@@ -1,19 +1,39 @@
 # 1. Standard Library
+import csv
+import io
+import sqlite3
 from collections.abc import Generator
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from typing import Any
+from unittest.mock import MagicMock
 
+import polars as pl
 import pytest
+from fastapi import HTTPException
 from pydantic import ValidationError
 
 # 2. Third-Party Libraries
-from sqlmodel import Session, SQLModel, create_engine, text
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, insert, text
 
-from app.data_access.m_views import FactAssetMetricsMView
+from app.data_access.m_views import FactAssetMetricsMView, TeamCostMView
+from app.data_access.models import DimCostCenter
 
 # 3. Application Layers
-from app.domain.gold_entities import AssetMetricContext, AssetUtilization
+from app.domain.cost_center import CostCenterDomain
+from app.domain.gold_entities import (
+    AssetMetricContext,
+    AssetUtilization,
+    ResourceEfficiency,
+    SecurityCompliance,
+    TeamCost,
+)
+from app.etl.pipeline import DataExtractor
+from app.services import cost_center_service
+from app.services.cost_center_service import CostCenterService
 from app.services.search_gold import GoldSearchService
+from app.services.seed_service import SeedService
 
 
 # --- Setup: Isolated Testing Environment ---
@@ -22,10 +42,15 @@ from app.services.search_gold import GoldSearchService
 def session_fixture() -> Generator[Session, Any, None]:
     """
     Creates a clean, in-memory SQLite database for every test.
-    Note: SQLite doesn't support schemas (gold.silver), so we simulate the tables
-    in the default schema for testing.
+    Note: SQLite doesn't support schemas (gold.silver), so each one is simulated
+    by attaching a separate in-memory database under that name.
     """
-    engine = create_engine("sqlite:///:memory:")
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_schemas(dbapi_conn: Any, _record: Any) -> None:
+        for schema in ("silver", "gold"):
+            dbapi_conn.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
     
     # Create the physical tables based on SQLModels
     SQLModel.metadata.create_all(engine)
@@ -63,6 +88,16 @@ def test_asset_utilization_valid_data() -> None:
     assert asset.resource_name == "prod-sql-01"
     assert asset.cpu_usage_avg == 45.0
 
+def test_asset_utilization_caps_cpu_spikes() -> None:
+    """Validates that CPU spikes above 100% are capped instead of rejected."""
+    asset = AssetUtilization(
+        metric_id=1, full_date=date.today(), resource_name="Test",
+        serial_number="S1", provider_name="AWS", team_name="IT",
+        center_code="C1", cpu_usage_avg=130.0, memory_usage_avg=10,
+        daily_cost=1.0
+    )
+    assert asset.cpu_usage_avg == 100.0
+
 def test_asset_metrics_constraints() -> None:
     """Validates that CPU usage must be between 0 and 100 via Pydantic."""
     with pytest.raises(ValidationError):
@@ -87,6 +122,38 @@ def test_asset_cost_non_negative() -> None:
             daily_cost=-100.0  # INVALID: negative cost
         )
 
+def test_unknown_categories_fall_back_to_defaults() -> None:
+    """Validates that unexpected or unhashable category values map to the safe defaults."""
+    posture = SecurityCompliance.model_validate({
+        "asset_id": 1, "resource_name": "Test", "serial_number": "S1", "tier_name": "Critical",
+        "env_name": ["Production"], "status_name": "Active"
+    })
+    efficiency = ResourceEfficiency.model_validate({
+        "asset_id": 1, "resource_name": "Test", "avg_cpu": 1.0, "avg_mem": 1.0, "total_cost": 1.0,
+        "efficiency_score": 1.0, "waste_index": None
+    })
+    assert posture.env_name == "Sandbox"
+    assert efficiency.waste_index == "Normal"
+
+def test_team_cost_month_round_trip() -> None:
+    """Validates that Gold month names are stored as ordinals and re-derived on output."""
+    cost = TeamCost.model_validate({
+        "year": 2023, "month_name": "october", "team_name": "IT",
+        "department": "Fin", "total_monthly_cost": 10.0, "avg_cpu_efficiency": 0.5
+    })
+    assert cost.month == 10
+    assert cost.model_dump()["month_name"] == "October"
+
+
+def test_team_cost_from_mview_row() -> None:
+    """Validates that Gold view rows map ``month_name`` onto ``month`` for both entry points."""
+    row = TeamCostMView(
+        year=2023, month_name="March", team_name="IT", department="Fin",
+        total_monthly_cost=10.0, avg_cpu_efficiency=0.5
+    )
+    assert TeamCost.model_validate(row).month == 3
+    assert TeamCost.from_db(row).month == 3
+
 
 # --- 2. Testing Service Logic (Search & Filtering) ---
 
@@ -103,7 +170,7 @@ def test_get_comprehensive_asset_metrics_service(session: Session) -> None:
         env_name="Production", status_name="Active", security_tier="Internal",
         full_date=date(2023, 10, 27), cpu_usage_avg=12.5, memory_usage_avg=30.0,
         hourly_cost=0.45, uptime_seconds=3600,
-        source_timestamp=datetime.now(), updated_at=datetime.now()
+        source_timestamp=datetime.now(UTC), updated_at=datetime.now(UTC)
     )
     session.add(mock_record)
     session.commit()
@@ -119,3 +186,188 @@ def test_get_comprehensive_asset_metrics_service(session: Session) -> None:
     # Verify Pydantic conversion worked
     assert isinstance(results[0], AssetMetricContext)
 
+
+def test_comprehensive_metrics_skips_malformed_rows(session: Session) -> None:
+    """Validates that out-of-range view rows are dropped instead of served unchecked."""
+    for row_id, cpu in ((1, 12.5), (2, 150.0)):
+        session.add(FactAssetMetricsMView(
+            id=row_id, asset_id=100 + row_id, resource_name=f"server-{row_id}",
+            serial_number=f"SN-{row_id}", provider_name="Azure", hardware_spec="Standard_D2",
+            region_code="westus", team_name="Analytics", department="Marketing",
+            center_code="MKT-01", service_name="VM", service_category="IaaS",
+            env_name="Production", status_name="Active", security_tier="Internal",
+            full_date=date(2023, 10, 27), cpu_usage_avg=cpu, memory_usage_avg=30.0,
+            hourly_cost=0.45, uptime_seconds=3600,
+            source_timestamp=datetime.now(UTC), updated_at=datetime.now(UTC)
+        ))
+    session.commit()
+
+    results = GoldSearchService(session).read_comprehensive_metrics()
+
+    assert [r.id for r in results] == [1]
+
+
+def _cost_center(code: str, department: str = "Finance", budget: float = 1000.0) -> CostCenterDomain:
+    return CostCenterDomain(
+        center_code=code, department=department, budget_limit=budget,
+        source_timestamp=datetime(2025, 1, 1, tzinfo=UTC)
+    )
+
+def test_create_cost_centers_batch_rejects_existing_codes(session: Session) -> None:
+    """Validates that a batch colliding with a stored code is rejected and fully rolled back."""
+    service = CostCenterService(session)
+    service.create_cost_center(_cost_center("CC-0001"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.create_cost_centers_batch([_cost_center("CC-0002"), _cost_center("CC-0001")])
+
+    assert exc_info.value.status_code == 400
+    assert "CC-0001" in exc_info.value.detail
+    assert [cc.center_code for cc in service.get_all_cost_centers()] == ["CC-0001"]
+
+def test_create_cost_centers_batch_returns_ids_in_input_order(session: Session) -> None:
+    """Validates that generated IDs come back matched to the input rows."""
+    service = CostCenterService(session)
+
+    created = service.create_cost_centers_batch([_cost_center("CC-0003"), _cost_center("CC-0001")])
+
+    assert [cc.center_code for cc in created] == ["CC-0003", "CC-0001"]
+    assert all(cc.id is not None for cc in created)
+    assert {cc.center_code: cc.id for cc in service.get_all_cost_centers()} == {
+        cc.center_code: cc.id for cc in created
+    }
+
+def test_create_cost_centers_batch_spans_insert_slices(session: Session) -> None:
+    """Validates that a batch larger than SQLite's bind-parameter limit is inserted in slices."""
+    # Builds differ in their default cap, so pin SQLite's stock 32766 the slices must stay under
+    raw_connection = session.connection().connection.driver_connection
+    assert raw_connection is not None
+    raw_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 32766)
+    service = CostCenterService(session)
+    codes = [f"CC-{i:04d}" for i in range(6000)]
+
+    created = service.create_cost_centers_batch([_cost_center(code) for code in codes])
+
+    assert [cc.center_code for cc in created] == codes
+    assert len({cc.id for cc in created}) == len(codes)
+
+def test_create_cost_centers_batch_copy_path(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Validates the COPY branch: CSV payload, FORCE_NOT_NULL, and the sliced read-back of IDs."""
+    copies: list[str] = []
+
+    class FakeCursor:
+        def copy_expert(self, sql: str, buffer: io.StringIO) -> None:
+            # Loads the CSV the way Postgres COPY would, through the same session
+            copies.append(sql)
+            names = ["center_code", "department", "budget_limit", "is_active", "source_timestamp", "updated_at"]
+            rows = [dict(zip(names, record, strict=True)) for record in csv.reader(buffer)]
+            session.execute(insert(DimCostCenter), [
+                {
+                    **row, "budget_limit": float(row["budget_limit"]), "is_active": row["is_active"] == "True",
+                    "source_timestamp": datetime.fromisoformat(row["source_timestamp"]),
+                    "updated_at": datetime.fromisoformat(row["updated_at"]),
+                }
+                for row in rows
+            ])
+
+        def close(self) -> None:
+            pass
+
+    raw_connection = MagicMock()
+    raw_connection.cursor.return_value = FakeCursor()
+    monkeypatch.setattr(session.get_bind().dialect, "name", "postgresql")
+    monkeypatch.setattr(cost_center_service, "IN_CLAUSE_BATCH_SIZE", 40)
+    service = CostCenterService(session)
+    monkeypatch.setattr(service.session, "connection", lambda: MagicMock(connection=raw_connection))
+
+    codes = [f"CC-{i:04d}" for i in range(cost_center_service.COPY_THRESHOLD)]
+    created = service.create_cost_centers_batch(
+        [_cost_center(code, department="" if code == "CC-0007" else "Finance") for code in codes]
+    )
+
+    assert len(copies) == 1 and "FORCE_NOT_NULL (center_code, department)" in copies[0]
+    assert [cc.center_code for cc in created] == codes
+    assert len({cc.id for cc in created}) == len(codes)
+    assert created[7].department == ""
+
+def test_update_cost_centers_batch_by_code(session: Session) -> None:
+    """Validates batch updates by business key, and that an unknown code aborts the whole batch."""
+    service = CostCenterService(session)
+    created = service.create_cost_centers_batch([_cost_center("CC-0001"), _cost_center("CC-0002")])
+
+    updated = service.update_cost_centers_batch([
+        _cost_center("CC-0001", department="Data", budget=2500.0),
+        _cost_center("CC-0002", department=""),
+    ])
+    assert [(cc.id, cc.department, cc.budget_limit) for cc in updated] == [
+        (created[0].id, "Data", 2500.0), (created[1].id, "", 1000.0)
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.update_cost_centers_batch([_cost_center("CC-0001", department="Ops"), _cost_center("CC-0009")])
+    assert exc_info.value.status_code == 404
+
+    stored = {cc.center_code: cc.department for cc in service.get_all_cost_centers()}
+    assert stored == {"CC-0001": "Data", "CC-0002": ""}
+
+def test_update_cost_centers_batch_keeps_omitted_timestamp(session: Session) -> None:
+    """Validates that a batch update without source_timestamp keeps the stored NOT NULL value."""
+    service = CostCenterService(session)
+    service.create_cost_center(_cost_center("CC-0001"))
+
+    updated = service.update_cost_centers_batch(
+        [CostCenterDomain(center_code="CC-0001", department="Ops", budget_limit=500.0)]
+    )
+
+    assert updated[0].source_timestamp is not None
+    assert updated[0].source_timestamp.replace(tzinfo=None) == datetime(2025, 1, 1)
+    stored = service.get_all_cost_centers()
+    assert [(cc.department, cc.budget_limit) for cc in stored] == [("Ops", 500.0)]
+
+def test_cost_center_writes_invalidate_listing_cache(session: Session) -> None:
+    """Validates that listing pages are cached until a service write invalidates them."""
+    service = CostCenterService(session)
+    service.create_cost_center(_cost_center("CC-0001"))
+    assert [cc.center_code for cc in service.get_all_cost_centers()] == ["CC-0001"]
+
+    # A write that bypasses the service is not seen while the page is cached
+    session.execute(insert(DimCostCenter).values(
+        center_code="CC-0002", department="Ops", budget_limit=1.0, is_active=True,
+        source_timestamp=datetime.now(UTC), updated_at=datetime.now(UTC)
+    ))
+    session.commit()
+    assert [cc.center_code for cc in service.get_all_cost_centers()] == ["CC-0001"]
+
+    service.create_cost_center(_cost_center("CC-0003"))
+    assert [cc.center_code for cc in service.get_all_cost_centers()] == ["CC-0001", "CC-0002", "CC-0003"]
+
+def test_seed_bronze_extracts_pdfs_in_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Validates that Bronze landing parses every PDF through one extract_many call, in order."""
+    storage = MagicMock()
+    storage.list.return_value = [
+        {"name": "providers_2024_a.pdf"}, {"name": ".emptyFolderPlaceholder"}, {"name": "regions_2024_b.pdf"}
+    ]
+    storage.download.side_effect = lambda path: path.encode()
+    service = SeedService.__new__(SeedService)
+    service.supabase = MagicMock()
+    service.supabase.storage.from_.return_value = storage
+    service.bucket_name, service.bronze_folder = "bucket", "bronze"
+    service.engine = create_engine("sqlite://")
+
+    extracted: list[list[bytes]] = []
+
+    def fake_extract_many(buffers: list[Any]) -> list[str]:
+        extracted.append([buffer.getvalue() for buffer in buffers])
+        return ["provider_name,rank\nAWS,1", "provider_name,rank\nGCP,2"]
+
+    landed: dict[str, list[str]] = {}
+    monkeypatch.setattr(DataExtractor, "extract_many", staticmethod(fake_extract_many))
+    monkeypatch.setattr(
+        pl.DataFrame, "write_database",
+        lambda df, table_name, **_: landed.__setitem__(table_name, df["provider_name"].to_list())
+    )
+
+    service._ingest_all_to_bronze()
+
+    assert extracted == [[b"bronze/providers_2024_a.pdf", b"bronze/regions_2024_b.pdf"]]
+    assert landed == {"bronze.providers": ["AWS"], "bronze.regions": ["GCP"]}